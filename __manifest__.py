@@ -20,9 +20,11 @@
         'security/supervisorio_groups.xml',
         'security/ir.model.access.csv',
         'data/supervisorio_manager_data.xml',
+        'data/ir_cron_data.xml',
         'views/res_config_settings_views.xml',
         'views/authenticity_check_views.xml',
         'views/portal_templates.xml',
+        'views/cycle_pdf_progress_templates.xml',
         'views/cycle_features_views.xml',
         'views/cycle_type_views.xml',
         'views/equipments_views.xml',
@@ -1,17 +1,127 @@
 from odoo import http
 from odoo.http import request, content_disposition
 import os
-import base64
 from io import BytesIO
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
+from werkzeug.http import quote_etag
+from werkzeug.wrappers import Response
+from werkzeug.wsgi import wrap_file
+from email.utils import formatdate
 import logging
 
 
 _logger = logging.getLogger(__name__)
 
+_ACTION_XMLID = 'afr_supervisorio_ciclos.action_report_txt_to_pdf'
+_STREAM_BUFFER_SIZE = 65536
+
+
+def _file_etag(st, *extra):
+    """
+    Monta o ETag de um arquivo a partir da data de modificação e do tamanho.
+
+    Args:
+        st (os.stat_result): Stat do arquivo de origem
+        *extra: Valores adicionais que também invalidam o conteúdo (ex.: write_date do registro)
+
+    Returns:
+        str: ETag sem aspas
+    """
+    parts = [f"{st.st_mtime_ns:x}", f"{st.st_size:x}"]
+    parts.extend(str(value) for value in extra if value)
+    return '-'.join(parts).replace(' ', '_')
+
+
+def _cache_headers(st, etag):
+    """
+    Headers de validação de cache para o download.
+
+    Args:
+        st (os.stat_result): Stat do arquivo de origem
+        etag (str): ETag sem aspas
+
+    Returns:
+        list: Lista de tuplas (header, valor)
+    """
+    return [
+        ('ETag', quote_etag(etag)),
+        ('Last-Modified', formatdate(st.st_mtime, usegmt=True)),
+        ('Cache-Control', 'private, max-age=0, must-revalidate'),
+    ]
+
+
+def _not_modified(etag, headers):
+    """
+    Retorna uma resposta 304 se o navegador já possui a versão atual do conteúdo.
+
+    Args:
+        etag (str): ETag sem aspas
+        headers (list): Headers de cache a repetir na resposta 304
+
+    Returns:
+        Response: Resposta 304 ou None se o conteúdo precisa ser enviado
+    """
+    # If-None-Match usa comparação fraca (RFC 9110): proxies podem enfraquecer o ETag (W/"...")
+    if request.httprequest.if_none_match.contains_weak(etag):
+        return Response(status=304, headers=headers)
+    return None
+
+
+def _stream_response(fileobj, size, content_type, filename, extra_headers=()):
+    """
+    Monta uma resposta que envia o arquivo em blocos, sem copiar o conteúdo para o corpo da resposta.
+
+    Args:
+        fileobj (file): Arquivo aberto em modo binário, posicionado no início
+        size (int): Tamanho do conteúdo em bytes
+        content_type (str): Tipo do conteúdo
+        filename (str): Nome do arquivo para download
+        extra_headers (list): Headers adicionais (ex.: cache)
+
+    Returns:
+        Response: Resposta com corpo iterável; o arquivo é fechado ao fim do envio
+    """
+    response = request.make_response(
+        wrap_file(request.httprequest.environ, fileobj, buffer_size=_STREAM_BUFFER_SIZE),
+        headers=[
+            ('Content-Type', content_type),
+            ('Content-Length', str(size)),
+            ('Content-Disposition', content_disposition(filename)),
+            *extra_headers
+        ]
+    )
+    response.direct_passthrough = True
+    return response
+
+
 class FileDownloadController(http.Controller):
 
+    # Cache do id do relatório QWeb por banco de dados, evita consultar ir.model.data a cada download
+    _report_ids = {}
+
+    @classmethod
+    def _get_report_txt_to_pdf(cls):
+        """
+        Retorna a ação do relatório TXT->PDF, resolvendo o xmlid apenas na primeira chamada
+        ou quando o id guardado deixar de existir.
+
+        Returns:
+            ir.actions.report: Registro do relatório ou recordset vazio se não existir
+        """
+        Report = request.env['ir.actions.report']
+        dbname = request.env.cr.dbname
+        report_id = cls._report_ids.get(dbname)
+        if report_id:
+            report = Report.browse(report_id).exists()
+            if report:
+                return report
+            # O relatório foi removido ou recriado (ex.: atualização do módulo)
+            cls._report_ids.pop(dbname, None)
+        report = request.env.ref(_ACTION_XMLID, raise_if_not_found=False)
+        if not report:
+            return Report
+        cls._report_ids[dbname] = report.id
+        return report
+
     @http.route('/web/content/download_file_txt_to_pdf_qweb/<int:record_id>', type='http', auth="user")
     def download_file_txt_to_pdf_qweb(self, record_id, **kwargs):
         """
@@ -25,15 +135,24 @@ class FileDownloadController(http.Controller):
         """
         record = request.env['afr.supervisorio.ciclos'].browse(record_id)
         
-        # Verifica se arquivo existe
-        if not record.file_path or not os.path.exists(record.file_path):
+        # Um único stat verifica se o arquivo existe e fornece os dados do ETag
+        try:
+            st = os.stat(record.file_path)
+        except (OSError, TypeError):
             return request.not_found()
             
+        # Reaproveita o PDF do navegador enquanto o TXT e o registro não mudarem
+        etag = _file_etag(st, record.write_date)
+        cache_headers = _cache_headers(st, etag)
+        not_modified = _not_modified(etag, cache_headers)
+        if not_modified:
+            return not_modified
+            
         try:
-            # Lê conteúdo do TXT
-            with open(record.file_path, 'r', encoding='utf-8') as file:
-                txt_content = file.read().replace('\x00', '')
-            _logger.info(f"txt_content: {txt_content}")
+            report = self._get_report_txt_to_pdf()
+            if not report:
+                return request.not_found()
+
             # Prepara dados para o template
             data = {
               
@@ -43,7 +162,7 @@ class FileDownloadController(http.Controller):
             }
             
             # Gera PDF usando QWeb
-            pdf = request.env.ref('afr_supervisorio_ciclos.action_report_txt_to_pdf')._render_qweb_pdf([record.id], data=data)[0]
+            pdf = report._render_qweb_pdf([record.id], data=data)[0]
             
             # Nome do arquivo
             filename = os.path.basename(record.file_path).replace('.txt', '.pdf')
@@ -53,97 +172,129 @@ class FileDownloadController(http.Controller):
                 pdf,
                 headers=[
                     ('Content-Type', 'application/pdf'),
-                    ('Content-Disposition', content_disposition(filename))
+                    ('Content-Disposition', content_disposition(filename)),
+                    *cache_headers
                 ]
             )
             
         except Exception as e:
             return request.not_found(f"Erro ao gerar PDF: {str(e)}")
 
-    @http.route('/web/content/download_file_txt_to_pdf/<int:record_id>', type='http', auth="user")
-    def download_file_txt_to_pdf(self, record_id, **kwargs):
-        record = request.env['afr.supervisorio.ciclos'].browse(record_id)
+    @http.route('/web/content/download_file_txt_to_pdf_qweb_batch', type='http', auth="user")
+    def download_file_txt_to_pdf_qweb_batch(self, record_ids='', **kwargs):
+        """
+        Rota para gerar um único PDF QWeb com vários ciclos, em uma só execução do wkhtmltopdf
         
-        msg_rodape = f"Ciclo cod.: {record.name} - Gerado pelo sistema FITADIGITAL"
-        pagina = 1
-        rodape_x = 130
-        rodape_y = 10
-        text_size = 8
-        leading = 0.1
-        line_space = 8
-        # Verifica se o arquivo existe
-        if not record.file_path or not os.path.exists(record.file_path):
+        Args:
+            record_ids (str): IDs dos registros de ciclo separados por vírgula
+            
+        Returns:
+            Response: PDF gerado com todos os ciclos
+        """
+        try:
+            ids = [int(record_id) for record_id in record_ids.split(',') if record_id.strip()]
+        except ValueError:
             return request.not_found()
-        
+
+        records = request.env['afr.supervisorio.ciclos'].browse(ids).exists().filtered('file_path')
+        if not records:
+            return request.not_found()
+
         try:
-            # Lê o arquivo TXT
-            with open(record.file_path, 'r', encoding='utf-8') as file:
-                txt_content = file.read().replace('\x00', '')
-           
-            # Cria um buffer para o PDF
-            pdf_buffer = BytesIO()
-            
-            # Cria o PDF
-            pdf = canvas.Canvas(pdf_buffer, pagesize=A4)
-            
-            # Define a fonte como Courier para manter o formato monospace
-            pdf.setFont('Courier', text_size, leading=leading)
-            
-            pdf.drawString(rodape_x,rodape_y,msg_rodape + " - Página " + str(pagina))
-           
-            y = 800  # Posição inicial do texto
-            
-            # Divide o conteúdo em linhas
-            lines = txt_content.split('\n')
-            
-            # Adiciona cada linha ao PDF
-            for line in lines:
-                if y < 50:  # Se chegou ao fim da página
-                    pdf.showPage()  # Nova página
-                    pdf.setFont('Courier', text_size, leading=leading)  # Precisa redefinir a fonte para nova página
-                    pagina += 1
-                    pdf.drawString(rodape_x,rodape_y,msg_rodape + " - Página " + str(pagina))
-                    y = 800  # Reset posição Y
-                
-                pdf.drawString(50, y, line)
-                y -= line_space  # Espaço entre linhas
-            
-            lines = record.cycle_statistics_txt.split('\n')
-            y = 800 
-            
-            pdf.showPage()  # Nova página
-            pagina += 1
-            pdf.setFont('Courier', text_size, leading=leading)  # Precisa redefinir a fonte para nova página
-            pdf.drawString(rodape_x,rodape_y,msg_rodape + " - Página " + str(pagina))
-            for line in lines:
-                if y < 50:  # Se chegou ao fim da página
-                    pdf.showPage()  # Nova página
-                    pdf.setFont('Courier', text_size, leading=leading)  # Precisa redefinir a fonte para nova página
-                    pagina += 1
-                    pdf.drawString(rodape_x,rodape_y,msg_rodape + " - Página " + str(pagina))
-                    y = 800  # Reset posição Y
-
-                pdf.drawString(50, y, line)
-                y -= line_space  # Espaço entre linhas
-            
-            pdf.save()
+            report = self._get_report_txt_to_pdf()
+            if not report:
+                return request.not_found()
+
+            data = {
+                'doc_ids': records.ids,
+                'doc_model': 'afr.supervisorio.ciclos',
+                'docs': records,
+            }
             
-            # Prepara o conteúdo do PDF
-            pdf_content = pdf_buffer.getvalue()
-            pdf_buffer.close()
+            # Gera o PDF de todos os registros em uma única renderização
+            pdf = report._render_qweb_pdf(records.ids, data=data)[0]
             
-            # Nome do arquivo para download
-            filename = os.path.basename(record.file_path).replace('.txt', '.pdf')
+            if len(records) == 1:
+                filename = os.path.basename(records.file_path).replace('.txt', '.pdf')
+            else:
+                filename = 'ciclos.pdf'
             
-            # Retorna o PDF
             return request.make_response(
-                pdf_content,
+                pdf,
                 headers=[
                     ('Content-Type', 'application/pdf'),
                     ('Content-Disposition', content_disposition(filename))
                 ]
             )
             
+        except Exception as e:
+            return request.not_found(f"Erro ao gerar PDF: {str(e)}")
+
+    @classmethod
+    def _stream_attachment(cls, attachment, filename, extra_headers=()):
+        """
+        Envia o conteúdo de um anexo, direto do filestore quando possível.
+
+        Args:
+            attachment (ir.attachment): Anexo a ser enviado
+            filename (str): Nome do arquivo para download
+            extra_headers (list): Headers adicionais (ex.: cache)
+
+        Returns:
+            Response: Resposta com o conteúdo do anexo
+        """
+        if attachment.store_fname:
+            file = open(attachment._full_path(attachment.store_fname), 'rb')
+            size = os.fstat(file.fileno()).st_size
+        else:
+            # Anexo armazenado no banco de dados
+            content = attachment.raw or b''
+            file = BytesIO(content)
+            size = len(content)
+        return _stream_response(file, size, attachment.mimetype or 'application/pdf', filename, extra_headers)
+
+    @http.route('/web/content/download_file_txt_to_pdf/<int:record_id>', type='http', auth="user")
+    def download_file_txt_to_pdf(self, record_id, retry=None, **kwargs):
+        """
+        Rota para baixar o PDF do ciclo gerado com ReportLab.
+
+        O PDF é gerado pelo cron de geração e guardado em cycle_pdf; enquanto não
+        fica pronto é exibida uma página de progresso que se recarrega sozinha.
+
+        Args:
+            record_id (int): ID do registro do ciclo
+            retry (str): Se informado, gera novamente um PDF que terminou com erro
+
+        Returns:
+            Response: PDF do ciclo ou página de progresso
+        """
+        record = request.env['afr.supervisorio.ciclos'].browse(record_id)
+        
+        # Um único stat verifica se o arquivo existe e se o PDF gerado está atualizado
+        try:
+            st = os.stat(record.file_path)
+        except (OSError, TypeError):
+            return request.not_found()
+        
+        try:
+            # PDF já gerado para a versão atual do arquivo: envia direto do filestore
+            if record._is_cycle_pdf_current(st):
+                attachment = record._get_cycle_pdf_attachment()
+                if attachment:
+                    etag = _file_etag(st, attachment.checksum)
+                    cache_headers = _cache_headers(st, etag)
+                    not_modified = _not_modified(etag, cache_headers)
+                    if not_modified:
+                        return not_modified
+                    filename = os.path.basename(record.file_path).replace('.txt', '.pdf')
+                    return self._stream_attachment(attachment, filename, cache_headers)
+
+            # Agenda a geração; ciclos já na fila ou sendo gerados não são agendados de novo
+            if record.generation_state != 'error' or retry:
+                record.action_generate_pdf_async(retry=bool(retry))
+
+            return request.render('afr_supervisorio_ciclos.cycle_pdf_progress', {'record': record})
+            
         except Exception as e:
             return request.not_found(str(e))  
 
@@ -151,25 +302,22 @@ class FileDownloadController(http.Controller):
     def download_file(self, record_id, **kwargs):
         record = request.env['afr.supervisorio.ciclos'].browse(record_id)
         
-        # Verifique se o arquivo existe
-        if not record.file_path or not os.path.exists(record.file_path):
+        # Abre o arquivo; se não existir, retorna 404. O conteúdo é enviado em blocos pelo servidor WSGI
+        try:
+            file = open(record.file_path, 'rb')
+        except (OSError, TypeError):
             return request.not_found()
+        st = os.fstat(file.fileno())
         
-        # Lê o arquivo
-        try:
-            with open(record.file_path, 'rb') as file:
-                file_content = file.read()
-        except Exception as e:
-            return request.not_found(str(e))
+        etag = _file_etag(st)
+        cache_headers = _cache_headers(st, etag)
+        not_modified = _not_modified(etag, cache_headers)
+        if not_modified:
+            file.close()
+            return not_modified
         
         # Nome do arquivo para download
         filename = os.path.basename(record.file_path)
         
         # Retorna o conteúdo com os headers apropriados
-        return request.make_response(
-            file_content,
-            headers=[
-                ('Content-Type', 'application/octet-stream'),
-                ('Content-Disposition', content_disposition(filename))
-            ]
-        )
+        return _stream_response(file, st.st_size, 'application/octet-stream', filename, cache_headers)
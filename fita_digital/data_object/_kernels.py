@@ -0,0 +1,97 @@
+"""
+Núcleos numéricos do modelo de mortalidade D-value.
+
+O núcleo usado em DataObjectFitaDigital é escolhido na importação, conforme as
+dependências opcionais instaladas: numba (laço compilado e paralelo), numexpr
+(expressão avaliada em blocos) ou NumPy vetorizado.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba é opcional; sem ele o cálculo usa NumPy vetorizado
+    njit = None
+    prange = range
+
+try:
+    import numexpr
+except ImportError:  # numexpr é opcional; sem ele as expressões são avaliadas pelo NumPy
+    numexpr = None
+
+# 10**x == exp2(x * log2(10)); exp2 é bem mais barato que pow nos arrays
+_LOG2_10 = float(np.log2(10.0))
+
+
+def _mortalidade_loop(minutos, temps, concs, N0, D_value, z_value, C_value, C_base, temp_base):
+    """
+    Núcleo do modelo D-value em laço explícito, compilado com numba quando disponível.
+
+    O tempo acumulado é calculado antes do laço, de modo que cada amostra é
+    independente das demais e o laço pode ser distribuído entre threads (prange).
+
+    Args:
+        minutos (numpy.ndarray): Duração de cada intervalo em minutos
+        temps (numpy.ndarray): Temperatura no início de cada intervalo
+        concs (numpy.ndarray): Concentração de ETO (kg/m³) no início de cada intervalo
+        N0 (float): População inicial
+        D_value, z_value, C_value, C_base, temp_base (float): Parâmetros do modelo
+
+    Returns:
+        numpy.ndarray: População ao fim de cada intervalo
+    """
+    n = minutos.shape[0]
+    tempo_acumulado = np.cumsum(minutos)
+    populacao = np.empty(n)
+    # Constantes por chamada calculadas fora do laço
+    k_temp = _LOG2_10 / z_value
+    k_conc = _LOG2_10 / C_value
+    k_log = -_LOG2_10 / D_value
+    for i in prange(n):
+        fator = np.exp2((temp_base - temps[i]) * k_temp + (C_base - concs[i]) * k_conc)
+        populacao[i] = N0 * np.exp2(tempo_acumulado[i] / fator * k_log)
+    return populacao
+
+
+def _mortalidade_numpy(minutos, temps, concs, N0, D_value, z_value, C_value, C_base, temp_base):
+    """
+    Núcleo do modelo D-value vetorizado com NumPy (mesmo cálculo de _mortalidade_loop).
+
+    Returns:
+        numpy.ndarray: População ao fim de cada intervalo
+    """
+    tempo_acumulado = np.cumsum(minutos)
+    # As duas potências de 10 do D-value viram um único exp2 da soma dos expoentes;
+    # D_value e log2(10) entram como escalares, fora das operações sobre os arrays
+    fator = np.exp2((temp_base - temps) * (_LOG2_10 / z_value) + (C_base - concs) * (_LOG2_10 / C_value))
+    return N0 * np.exp2(tempo_acumulado / fator * (-_LOG2_10 / D_value))
+
+
+def _mortalidade_numexpr(minutos, temps, concs, N0, D_value, z_value, C_value, C_base, temp_base):
+    """
+    Núcleo do modelo D-value avaliado pelo numexpr (mesmo cálculo de _mortalidade_loop).
+
+    A expressão inteira é avaliada em blocos e em várias threads, sem criar os
+    arrays intermediários de cada potência de 10.
+
+    Returns:
+        numpy.ndarray: População ao fim de cada intervalo
+    """
+    tempo_acumulado = np.cumsum(minutos)
+    return numexpr.evaluate(
+        "N0 * 10.0 ** (-tempo_acumulado / (D_value * 10.0 ** ("
+        "(temp_base - temps) / z_value + (C_base - concs) / C_value)))",
+        local_dict={
+            'tempo_acumulado': tempo_acumulado, 'temps': temps, 'concs': concs,
+            'N0': N0, 'D_value': D_value, 'z_value': z_value,
+            'C_value': C_value, 'C_base': C_base, 'temp_base': temp_base,
+        },
+    )
+
+
+if njit:
+    _mortalidade_kernel = njit(cache=True, parallel=True, fastmath=True)(_mortalidade_loop)
+elif numexpr:
+    _mortalidade_kernel = _mortalidade_numexpr
+else:
+    _mortalidade_kernel = _mortalidade_numpy
+
@@ -1,10 +1,330 @@
+import functools
+import io
+from bisect import bisect_left
+import mmap
 import os
 import re
 import logging
-from datetime import datetime, timedelta
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+from datetime import datetime
 _logger = logging.getLogger(__name__)
 import numpy as np
+
+from ._kernels import _mortalidade_kernel
+
+# Acima deste número de arquivos os stat são feitos em paralelo
+_STAT_POOL_THRESHOLD = 1024
+_STAT_POOL_WORKERS = 16
+# Subdiretórios de primeiro nível (um por equipamento) percorridos em paralelo
+_DIR_POOL_WORKERS = 8
+
+# Campos do cabeçalho e padrão de horário, compartilhados por todas as instâncias
+_HEADER_FIELDS = ("Data:", "Hora:", "Ciclo:", "Equipamento:", "Operador:", "Cod. ciclo:", "Ciclo Selecionado:")
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{1,2}):(\d{1,2})')
+
+
+def _list_dir(base, exts=()):
+    """
+    Lista um único nível de um diretório usando os.scandir.
+
+    Args:
+        base (str): Diretório a listar
+        exts (tuple): Extensões aceitas; vazio aceita todos os arquivos
+
+    Returns:
+        tuple: (lista de caminhos de subdiretórios, lista de os.DirEntry de arquivos)
+    """
+    subdirs, files = [], []
+    try:
+        with os.scandir(base) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                # Filtra pelo nome antes de is_file(), que pode exigir um stat
+                elif (not exts or entry.name.endswith(exts)) and entry.is_file():
+                    files.append(entry)
+    except OSError:
+        pass
+    return subdirs, files
+
+
+def _walk(base, exts=()):
+    """
+    Percorre recursivamente um diretório usando os.scandir.
+
+    Args:
+        base (str): Diretório inicial
+        exts (tuple): Extensões aceitas; vazio aceita todos os arquivos
+
+    Yields:
+        os.DirEntry: Entradas de arquivo encontradas, com o stat em cache
+    """
+    stack = [base]
+    while stack:
+        subdirs, files = _list_dir(stack.pop(), exts)
+        stack.extend(subdirs)
+        yield from files
+
+
+def _stat_entry(entry):
+    """
+    Retorna o stat de uma entrada de diretório, ou None se o arquivo não puder ser lido.
+
+    Args:
+        entry (os.DirEntry): Entrada de diretório
+
+    Returns:
+        os.stat_result: Resultado do stat ou None
+    """
+    try:
+        return entry.stat()
+    except OSError:
+        return None
+
+
+def _stat_entries(entries):
+    """
+    Obtém o stat de várias entradas de diretório.
+
+    Em arquivos de ciclo grandes (ex.: montagens de rede) o tempo é dominado pela
+    latência de cada stat; acima de _STAT_POOL_THRESHOLD arquivos as chamadas são
+    feitas em um pool de threads para manter várias requisições em andamento.
+
+    Args:
+        entries (list): Lista de os.DirEntry
+
+    Returns:
+        list: Resultados do stat na mesma ordem das entradas (None em caso de erro)
+    """
+    if len(entries) <= _STAT_POOL_THRESHOLD:
+        return [_stat_entry(entry) for entry in entries]
+    with ThreadPoolExecutor(max_workers=_STAT_POOL_WORKERS) as pool:
+        return list(pool.map(_stat_entry, entries))
+
+
+def _arquivos_info(entries, stats, di_ts, df_ts):
+    """
+    Monta as informações dos arquivos cuja data de modificação está no intervalo.
+
+    Args:
+        entries (list): Lista de os.DirEntry
+        stats (list): Resultados do stat na mesma ordem (None em caso de erro)
+        di_ts (float): Timestamp inicial do filtro
+        df_ts (float): Timestamp final do filtro
+
+    Returns:
+        list: Lista de dicionários com name, path, create_date e change_date
+    """
+    arquivos = []
+    for entry, st in zip(entries, stats):
+        if st is None:
+            continue
+
+        # Filtro de data; datetime só é criado para os arquivos aprovados
+        mtime = st.st_mtime
+        if not di_ts <= mtime <= df_ts:
+            continue
+
+        arquivos.append({
+            'name': entry.name,
+            'path': os.path.dirname(entry.path),
+            'create_date': datetime.fromtimestamp(st.st_ctime),
+            'change_date': datetime.fromtimestamp(mtime)
+        })
+    return arquivos
+
+
+def _scan_subdir(path, exts, di_ts, df_ts):
+    """
+    Percorre um subdiretório e retorna seus arquivos filtrados por data.
+
+    Executado em uma thread do pool de ler_diretorio_ciclos; os stat são feitos
+    em sequência, pois o paralelismo já vem dos subdiretórios.
+
+    Args:
+        path (str): Subdiretório a percorrer
+        exts (tuple): Extensões aceitas
+        di_ts (float): Timestamp inicial do filtro
+        df_ts (float): Timestamp final do filtro
+
+    Returns:
+        list: Lista de dicionários de arquivos (ver _arquivos_info)
+    """
+    entries = list(_walk(path, exts))
+    return _arquivos_info(entries, [_stat_entry(entry) for entry in entries], di_ts, df_ts)
+
+
+def _hms_to_seconds(times):
+    """
+    Converte horários no formato fixo HH:MM:SS em segundos do dia, direto dos bytes.
+
+    Args:
+        times (list): Lista de strings de horário
+
+    Returns:
+        numpy.ndarray: Segundos do dia (int64), ou None se algum horário não estiver
+        exatamente no formato HH:MM:SS
+    """
+    try:
+        raw = np.array(times, dtype='S')
+    except UnicodeEncodeError:
+        return None
+    if raw.dtype.itemsize != 8:
+        return None
+    chars = raw.view(np.uint8).reshape(-1, 8)
+    if (chars[:, 2] != 58).any() or (chars[:, 5] != 58).any():  # ':'
+        return None
+    digits = chars[:, [0, 1, 3, 4, 6, 7]].astype(np.int64) - 48  # '0'
+    if (digits < 0).any() or (digits > 9).any():
+        return None
+    h = digits[:, 0] * 10 + digits[:, 1]
+    m = digits[:, 2] * 10 + digits[:, 3]
+    sec = digits[:, 4] * 10 + digits[:, 5]
+    if (h > 23).any() or (m > 59).any() or (sec > 59).any():
+        return None
+    return h * 3600 + m * 60 + sec
+
+
+def _moda(valores):
+    """
+    Calcula a moda de um array; em caso de empate retorna o valor que aparece primeiro,
+    como statistics.mode.
+
+    Args:
+        valores (numpy.ndarray): Valores da coluna
+
+    Returns:
+        float: Moda dos valores, ou None se o array estiver vazio
+    """
+    if not len(valores):
+        return None
+    unicos, primeiro, contagem = np.unique(valores, return_index=True, return_counts=True)
+    empatados = contagem == contagem.max()
+    return float(unicos[empatados][primeiro[empatados].argmin()])
+
+
+def _indice_fases(fases):
+    """
+    Monta o índice nome da fase -> posições em que a fase aparece na lista de fases.
+
+    Args:
+        fases (list): Lista de fases [[hora, nome], ...]
+
+    Returns:
+        dict: Dicionário {nome: [posições em ordem crescente]}
+    """
+    fase_index = {}
+    for i, fase in enumerate(fases or ()):
+        fase_index.setdefault(fase[1], []).append(i)
+    return fase_index
+
+
+def _arrays_medicoes(dados, header_columns, fases=None, tempos=None, tempos_fase=None):
+    """
+    Monta as medições em colunas NumPy (uma por variável).
+
+    Usado pelo DataObjectFitaDigital e pelos leitores de fita. Os horários podem ser
+    datetimes (convertidos em datetime64[us]) ou as strings lidas da fita. As linhas
+    podem ter larguras diferentes; são usadas as colunas presentes em todas elas.
+
+    Args:
+        dados (list): Linhas de medição [hora, valor1, valor2, ...]
+        header_columns (list): Nomes das colunas, incluindo a de hora
+        fases (list, opcional): Lista de fases [[hora, nome], ...]
+        tempos (numpy.ndarray, opcional): Horários das medições em datetime64[us],
+            quando já convertidos
+        tempos_fase (numpy.ndarray, opcional): Horários das fases em datetime64[us]
+
+    Returns:
+        dict: Dicionário com:
+            - time (numpy.ndarray): Horários das medições (datetime64[us] ou strings)
+            - time_i8 (numpy.ndarray): Visão int64 (microssegundos) de time, ou None
+              se os horários forem strings
+            - fase_i8 (numpy.ndarray): Horários das fases em int64 (microssegundos),
+              ou None se os horários forem strings
+            - fase_index (dict): Nome da fase -> posições em fases
+            - time_sorted (bool): Se os horários estão em ordem crescente
+            - values (numpy.ndarray): Matriz float64 com as colunas numéricas
+            - columns (dict): Nome da coluna -> visão da coluna em values
+    """
+    if tempos is None:
+        tempos = [linha[0] for linha in dados]
+        if not tempos or isinstance(tempos[0], datetime):
+            tempos = np.array(tempos, dtype='datetime64[us]')
+        else:
+            tempos = np.array(tempos)
+
+    if tempos.dtype.kind == 'M':
+        ts = tempos.view('i8')
+        if tempos_fase is None:
+            tempos_fase = np.array([fase[0] for fase in fases or ()], dtype='datetime64[us]')
+        fase_i8 = tempos_fase.view('i8')
+    else:
+        ts = None
+        fase_i8 = None
+
+    largura = min((len(linha) for linha in dados), default=1) - 1
+    valores = np.array([linha[1:largura + 1] for linha in dados],
+                       dtype=np.float64).reshape(len(dados), largura)
+
+    body_arr = {
+        'time': tempos,
+        'time_i8': ts,
+        'fase_i8': fase_i8,
+        'time_sorted': bool(len(tempos) < 2 or (tempos[1:] >= tempos[:-1]).all()),
+        'values': valores,
+        'fase_index': _indice_fases(fases),
+        'columns': {coluna: valores[:, i]
+                    for i, coluna in enumerate(header_columns[1:largura + 1])},
+    }
+    return body_arr
+
+
+def _selecao_entre(body_arr, inicio, fim):
+    """
+    Retorna a seleção das medições com horário entre inicio e fim (inclusive).
+
+    Com os horários em ordem crescente os limites são achados por busca binária e a
+    seleção é um slice; caso contrário é um array de índices.
+
+    Args:
+        body_arr (dict): Colunas montadas por _arrays_medicoes
+        inicio (datetime | str): Limite inicial
+        fim (datetime | str): Limite final
+
+    Returns:
+        slice | numpy.ndarray: Seleção aplicável às colunas de body_arr
+    """
+    tempos = body_arr['time_i8']
+    if tempos is not None:
+        inicio = np.datetime64(inicio, 'us').astype('i8')
+        fim = np.datetime64(fim, 'us').astype('i8')
+    else:
+        tempos = body_arr['time']
+    if body_arr['time_sorted']:
+        lo = int(np.searchsorted(tempos, inicio, side='left'))
+        hi = int(np.searchsorted(tempos, fim, side='right'))
+        return slice(lo, hi)
+    return np.flatnonzero((tempos >= inicio) & (tempos <= fim))
+
+
+def _apply_day_rollover(arr):
+    """
+    Soma um dia a cada vez que o horário diminui em relação ao anterior (virada de dia).
+
+    Args:
+        arr (numpy.ndarray): Array datetime64 na mesma data, em ordem de leitura
+
+    Returns:
+        numpy.ndarray: O próprio array, com os dias acumulados somados
+    """
+    if len(arr) > 1:
+        rollover = np.cumsum(np.diff(arr).astype('int64') < 0).astype('timedelta64[D]')
+        arr[1:] += rollover
+    return arr
+
+
 class DataObjectFitaDigital:
     """
     Classe para manipulação de arquivos de fita digital.
@@ -46,11 +366,36 @@ class DataObjectFitaDigital:
         self.directory_path = directory_path
         self.header_fita = {}
         self.body_fita = {}
-        self.header_fields = ["Data:","Hora:","Ciclo:","Equipamento:","Operador:","Cod. ciclo:","Ciclo Selecionado:"]
+        self.header_fields = _HEADER_FIELDS
         self.size_header = 25
         self.lines_file = []
         self.lines_body_raw = []
         self.body = {}
+
+    @classmethod
+    def parse_time(cls, horario):
+        """
+        Extrai horas, minutos e segundos de um horário no formato HH:MM:SS.
+
+        Args:
+            horario (str): Horário no formato HH:MM:SS (aceita campos com um dígito, como o strptime)
+
+        Returns:
+            tuple: (horas, minutos, segundos) como inteiros
+
+        Raises:
+            ValueError: Se o horário não estiver no formato esperado
+
+        Exemplo:
+            >>> DataObjectFitaDigital.parse_time("10:30:05")
+            (10, 30, 5)
+        """
+        match = _TIME_RE.match(horario.strip())
+        if not match:
+            raise ValueError(f"Horário inválido: {horario}")
+        h, m, sec = match.groups()
+        return int(h), int(m), int(sec)
+
     def set_size_header(self, size_header):
         """
         Define o tamanho do cabeçalho do arquivo de fita.
@@ -87,57 +432,90 @@ class DataObjectFitaDigital:
             ...     data_final=datetime(2024,1,31)
             ... )
         """
-        arquivos = []
-        
         # Define extensão padrão se None
         if extension_file_search is None:
             extension_file_search = [".txt"]
-        
-        # Usa pathlib para manipulação de caminhos
-        base_path = Path(directory_path)
+        # str.endswith aceita tupla, evitando um any(...) por arquivo
+        exts = tuple(extension_file_search)
         
         # Verifica se o diretório existe
-        if not base_path.exists():
-            return arquivos
+        if not os.path.isdir(directory_path):
+            return []
             
         # Se data_inicial não fornecida mas data_final sim, não precisa filtrar por data inicial
         # Se data_final não fornecida mas data_inicial sim, usa data atual como final
         if data_inicial and not data_final:
             data_final = datetime.now()
+
+        # Limites em timestamp para comparar direto com o stat, sem criar datetime;
+        # limites abertos viram infinito e dispensam testes por arquivo
+        di_ts = data_inicial.timestamp() if data_inicial else float('-inf')
+        df_ts = data_final.timestamp() if data_final else float('inf')
             
-        # Itera recursivamente sobre todos os arquivos em todos os subdiretórios
-        for arquivo in base_path.rglob("*"):
-            if not arquivo.is_file():
-                continue
-        
-            # Verifica extensões
-            if extension_file_search and not any(str(arquivo).endswith(ext) for ext in extension_file_search):
-                continue
-                
-            try:
-                # Obtém datas de criação e modificação
-                create_date = datetime.fromtimestamp(os.path.getctime(arquivo))
-                change_date = datetime.fromtimestamp(os.path.getmtime(arquivo))
-                
-                # Só aplica filtro de data se alguma data foi fornecida
-                if data_inicial or data_final:
-                    if data_inicial and change_date < data_inicial:
-                        continue
-                    if data_final and change_date > data_final:
-                        continue
-                    
-                arquivo_info = {
-                    'name': arquivo.name,
-                    'path': str(arquivo.parent),
-                    'create_date': create_date, 
-                    'change_date': change_date
-                }
-                arquivos.append(arquivo_info)
-                
-            except Exception:
-                continue
+        # Arquivos do primeiro nível e subdiretórios (normalmente um por equipamento)
+        subdirs, entries = _list_dir(directory_path, exts)
+
+        if len(subdirs) > 1:
+            # Cada subdiretório é percorrido em uma thread; os.scandir e os.stat
+            # liberam o GIL, sobrepondo a latência de metadados entre eles
+            arquivos = _arquivos_info(entries, _stat_entries(entries), di_ts, df_ts)
+            with ThreadPoolExecutor(max_workers=min(_DIR_POOL_WORKERS, len(subdirs))) as pool:
+                partes = pool.map(lambda path: _scan_subdir(path, exts, di_ts, df_ts), subdirs)
+                arquivos.extend(chain.from_iterable(partes))
+            return arquivos
+
+        # Coleta recursivamente os arquivos com as extensões desejadas
+        for path in subdirs:
+            entries.extend(_walk(path, exts))
+
+        # Um único stat por arquivo fornece as datas de criação e modificação
+        return _arquivos_info(entries, _stat_entries(entries), di_ts, df_ts)
+
+    def process_directory(self, reader_cls, directory_path="", extension_file_search=None,
+                          data_inicial=None, data_final=None, size_header=None, max_workers=None):
+        """
+        Lê em paralelo todas as fitas de um diretório, uma por processo.
+
+        Cada arquivo é independente; a leitura e a interpretação das linhas são
+        limitadas pela CPU, por isso são distribuídas em processos (sem o GIL).
+
+        Uso restrito a scripts e ferramentas fora do Odoo (ex.: exemplo.py). Não
+        deve ser chamado pelos modelos: dentro de um worker do Odoo o
+        ProcessPoolExecutor faria fork do servidor inteiro, inclusive das conexões
+        com o banco de dados.
+
+        Args:
+            reader_cls (type): Classe do leitor de fita (ex.: ReaderFitaDigitalAfr13)
+            directory_path (str): Diretório dos ciclos; se vazio, usa self.directory_path
+            extension_file_search (list): Extensões aceitas (ver ler_diretorio_ciclos)
+            data_inicial (datetime): Data inicial para filtro (opcional)
+            data_final (datetime): Data final para filtro (opcional)
+            size_header (int): Tamanho do cabeçalho repassado a register_reader_fita
+            max_workers (int): Número de processos; None usa o número de CPUs
+
+        Returns:
+            list: Um dicionário por arquivo, na ordem de ler_diretorio_ciclos, com:
+                - path (str): Caminho completo do arquivo
+                - header (dict): Cabeçalho da fita, ou None em caso de erro
+                - body (dict): Corpo da fita, ou None em caso de erro
+                - error (str): Mensagem de erro, ou None
+
+        Exemplo:
+            >>> do = DataObjectFitaDigital("/ciclos/ETO01/")
+            >>> resultados = do.process_directory(ReaderFitaDigitalAfr13)
+            >>> resultados[0]['header']['Equipamento:']
+            'ETO01'
+        """
+        arquivos = self.ler_diretorio_ciclos(directory_path or self.directory_path,
+                                             extension_file_search, data_inicial, data_final)
+        paths = [os.path.join(arquivo['path'], arquivo['name']) for arquivo in arquivos]
+        if not paths:
+            return []
+
+        leitura = functools.partial(_read_fita_file, reader_cls, size_header=size_header)
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(leitura, paths, chunksize=8))
 
-        return arquivos
     def _cut_header_fita(self,file_name, size_header=25 ):
         """
         Extrai o cabeçalho de um arquivo de fita.
@@ -149,9 +527,9 @@ class DataObjectFitaDigital:
         Returns:
             str: Conteúdo do cabeçalho
         """
-        with open(self.directory_path + file_name, 'r') as file:
-            header = file.read(size_header)
-            return header
+        # Lê só os bytes do cabeçalho, sem a camada de texto sobre o arquivo
+        with open(self.directory_path + file_name, 'rb') as file:
+            return file.read(size_header).decode('utf-8', 'replace')
     
     def _read_file_fita(self,file_name, size_header=25 ):
         """
@@ -230,28 +608,29 @@ class DataObjectFitaDigital:
             if not self.body_fita or 'data' not in self.body_fita:
                 raise ValueError("Não foram encontrados dados válidos no corpo da fita")
                 
-            # Extrai e converte os horários para datetime
-            horarios = [linha[0] for linha in self.body_fita['data']]
-            # Converte os horários para datetime utilizando como base a data do cabeçalho da fita
-            times = self.time_to_datetime(horarios, self.header_fita[self.reader_fita.header_fields.date_key])
+            data = self.body_fita['data']
+            fases = self.body_fita.get('fase') or []
+            start_date = self.header_fita[self.reader_fita.header_fields.date_key]
+
+            # Converte os horários das medições e das fases em uma única passada,
+            # utilizando como base a data do cabeçalho da fita
+            tempos, tempos_fase = self._times_to_datetime64_groups(
+                [[linha[0] for linha in data], [fase[0] for fase in fases]], start_date)
             
-            # Atualiza os horários no body_fita['data']
-            for i, time in enumerate(times):
-                self.body_fita['data'][i][0] = time
-
-            # Converte os horários das fases para datetime
-            if 'fase' in self.body_fita:
-                horarios_fase = [fase[0] for fase in self.body_fita['fase']]
-                # convertendo para datetime utilizando como base a data do cabeçalho da fita
-                times_fase = self.time_to_datetime(horarios_fase, self.header_fita[self.reader_fita.header_fields.date_key])
-                
-                # Atualiza os horários no body_fita['fase']
-                for i, time in enumerate(times_fase):
-                    self.body_fita['fase'][i][0] = time
+            # Atualiza os horários no body_fita['data'] e no body_fita['fase']
+            times = tempos.astype(object).tolist()
+            for linha, time in zip(data, times):
+                linha[0] = time
+            for fase, time in zip(fases, tempos_fase.astype(object).tolist()):
+                fase[0] = time
+
+            # As colunas NumPy reaproveitam os horários já convertidos
+            self._materialize_arrays(tempos, tempos_fase)
                     
             # Adiciona o estado do ciclo ao corpo da fita
             self.body_fita['state'] = self.reader_fita.get_state()
-            _logger.debug(f"Processados {len(times)} registros de medição")
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug("Processados %s registros de medição", len(times))
             
             return self.body_fita
             
@@ -326,6 +705,51 @@ class DataObjectFitaDigital:
 
         return self.header_fita, self.body_fita
     
+    def read_all_fita_fast(self):
+        """
+        Lê o cabeçalho e o corpo da fita com uma única leitura do arquivo.
+
+        O arquivo é mapeado em memória (com aviso de leitura sequencial ao kernel) e as
+        linhas são entregues ao leitor registrado, que então não precisa abrir o
+        arquivo novamente. Indicado para importação em lote de muitos ciclos.
+
+        Returns:
+            tuple: (header_fita, body_fita) contendo os dados completos da fita
+
+        Exemplo:
+            >>> do = DataObjectFitaDigital("/caminho/para/ciclos/")
+            >>> do.register_reader_fita(ReaderFitaDigitalAfr("arquivo.txt"))
+            >>> header, body = do.read_all_fita_fast()
+        """
+        with open(self.reader_fita.file_name, 'rb') as file:
+            text = self._decode_file_mmap(file)
+
+        # StringIO com newline=None traduz as quebras de linha como a leitura em modo texto
+        self.reader_fita.lines_file = io.StringIO(text, newline=None).readlines()
+        return self.read_all_fita()
+
+    def _decode_file_mmap(self, file):
+        """
+        Decodifica o arquivo direto do page cache, via mmap, sem copiá-lo antes para um bytes.
+
+        Os caracteres nulos gravados pelos equipamentos são removidos como em
+        ReaderFitaDigitalInterface._read_lines; só nesse caso o conteúdo é copiado.
+
+        Args:
+            file (file): Arquivo aberto em modo binário
+
+        Returns:
+            str: Conteúdo do arquivo decodificado como UTF-8, sem caracteres nulos
+        """
+        if os.fstat(file.fileno()).st_size == 0:
+            return ''  # mmap não aceita arquivos vazios
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            if mm.find(b'\x00') != -1:
+                return mm[:].translate(None, b'\x00').decode('utf-8', 'replace')
+            return str(mm, 'utf-8', 'replace')
+
     def make_graph(self):
         """
         Gera um gráfico do ciclo de esterilização/termodesinfecção.
@@ -357,9 +781,13 @@ class DataObjectFitaDigital:
         graph = self.reader_fita.make_graph(self.header_fita, self.body_fita)
         return graph
     
-    def _converter_horario_para_minutos(self, horario):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _converter_horario_para_minutos(horario):
         """
         Converte um horário no formato HH:MM:SS para minutos totais.
+
+        Os horários repetem-se entre fases, por isso o resultado fica em cache.
         
         Args:
             horario (str): Horário no formato HH:MM:SS
@@ -370,6 +798,20 @@ class DataObjectFitaDigital:
         h, m, s = map(int, horario.split(':'))
         return h * 60 + m + s/60
 
+    def _formatar_segundos(self, total_s):
+        """
+        Formata segundos totais para o formato HH:MM:SS.
+        
+        Args:
+            total_s (int): Total de segundos
+            
+        Returns:
+            str: Tempo formatado como HH:MM:SS
+        """
+        m, s = divmod(total_s, 60)
+        h, m = divmod(m, 60)
+        return f"{h:02d}:{m:02d}:{s:02d}"
+
     def _formatar_tempo(self, minutos_totais):
         """
         Formata minutos totais para o formato HH:MM:SS.
@@ -380,10 +822,7 @@ class DataObjectFitaDigital:
         Returns:
             str: Tempo formatado como HH:MM:SS
         """
-        horas = int(minutos_totais // 60)
-        minutos = int(minutos_totais % 60)
-        segundos = int((minutos_totais * 60) % 60)
-        return f"{horas:02d}:{minutos:02d}:{segundos:02d}"
+        return self._formatar_segundos(int(minutos_totais * 60))
 
     def calcular_tempo_entre_fases(self, indice_inicial, indice_final):
         """
@@ -403,24 +842,26 @@ class DataObjectFitaDigital:
         
         try:
             fases = self.body_fita['fase']
-            data = self.body_fita['data']
             if not self.body_fita or 'fase' not in self.body_fita:
                 raise ValueError("Dados da fita não foram carregados")
+
+            body_arr = self._materialize_arrays()
+            fases_i8 = body_arr['fase_i8']
             
             #se não for fornecido o indice final, calcula o tempo entre o último registro de data e o índice inicial da fase
             if indice_inicial and indice_final == None:
-                tempo_diferenca = data[-1][0] - fases[indice_inicial][0]
+                tempo_diferenca = int(body_arr['time_i8'][-1] - fases_i8[indice_inicial])
                 return self._converter_tempo_diferenca_str(tempo_diferenca)
 
             if indice_inicial > indice_final:
                 raise ValueError("O índice inicial deve ser menor que o índice final")
 
-            print(f"fases: {fases}")
+            _logger.debug("fases: %s", fases)
             if not (0 <= indice_inicial < len(fases) and 0 <= indice_final < len(fases)):
                 raise IndexError("Índices fora do intervalo válido")
 
-            # Calcula a diferença direta entre os objetos datetime
-            tempo_diferenca = fases[indice_final][0] - fases[indice_inicial][0]
+            # Diferença em microssegundos entre os horários das fases
+            tempo_diferenca = int(fases_i8[indice_final] - fases_i8[indice_inicial])
             
             return self._converter_tempo_diferenca_str(tempo_diferenca)
            
@@ -431,14 +872,17 @@ class DataObjectFitaDigital:
         except Exception as e:
             raise Exception(f"Erro ao calcular tempo entre fases: {str(e)}")
     
-    def _converter_tempo_diferenca_str(self,tempo_diferenca):
+    def _converter_tempo_diferenca_str(self, delta_us):
         """
-        Converte a diferença de tempo para o formato HH:MM:SS
+        Converte uma diferença de tempo em microssegundos para o formato HH:MM:SS
+
+        Args:
+            delta_us (int): Diferença de tempo em microssegundos (int64 de body_arr)
+
+        Returns:
+            str: Tempo formatado como HH:MM:SS
         """
-        horas = int(tempo_diferenca.total_seconds() // 3600)
-        minutos = int((tempo_diferenca.total_seconds() % 3600) // 60)
-        segundos = int(tempo_diferenca.total_seconds() % 60)
-        return f"{horas:02d}:{minutos:02d}:{segundos:02d}"
+        return self._formatar_segundos(int(delta_us) // 1_000_000)
 
     def calcular_tempo_total_ciclo(self):
         """
@@ -459,9 +903,10 @@ class DataObjectFitaDigital:
             if not dados:
                 raise ValueError("Não há dados de medição disponíveis")
 
-            # Como os tempos já são datetime, basta subtrair o último do primeiro
-            tempo_total = dados[-1][0] - dados[0][0]
-            _logger.debug(f"tempo_total: {tempo_total}")
+            # Diferença em microssegundos entre o último e o primeiro horário
+            tempos = self._materialize_arrays()['time_i8']
+            tempo_total = int(tempos[-1] - tempos[0])
+            _logger.debug("tempo_total (us): %s", tempo_total)
             # Converte a diferença de tempo para o formato HH:MM:SS
             return self._converter_tempo_diferenca_str(tempo_total)
 
@@ -488,9 +933,53 @@ class DataObjectFitaDigital:
             >>> time_to_datetime(times, start_date)
             [datetime(2024,1,1,10,30,0), datetime(2024,1,1,11,45,0)]
         """
-        time_objects = [datetime.strptime(t, "%H:%M:%S") for t in times]
-        time_objects = self.replace_date_in_times(time_objects, start_date.strftime("%Y-%m-%d"))
-        return time_objects
+        if not times:
+            return []
+        date_str = start_date.strftime('%Y-%m-%d')
+        secs = _hms_to_seconds(times)
+        try:
+            if secs is not None:
+                # Formato fixo HH:MM:SS: soma os segundos do dia à data, sem interpretar texto
+                arr = np.datetime64(date_str, 's') + secs.astype('timedelta64[s]')
+            else:
+                # Concatena a data aos horários e converte tudo de uma vez para datetime64
+                joined = np.char.add(f"{date_str}T", np.asarray(times, dtype=str))
+                arr = joined.astype('datetime64[s]')
+        except ValueError:
+            # Horários fora do formato HH:MM:SS, usa a conversão elemento a elemento,
+            # montando o datetime já na data de início
+            y, m, d = start_date.year, start_date.month, start_date.day
+            arr = np.array([datetime(y, m, d, *self.parse_time(t)) for t in times],
+                           dtype='datetime64[us]')
+
+        return _apply_day_rollover(arr).astype(object).tolist()
+
+    def _times_to_datetime64_groups(self, groups, start_date):
+        """
+        Converte vários grupos de horários com uma única conversão dos textos.
+
+        A virada de dia é aplicada separadamente em cada grupo, como em time_to_datetime.
+
+        Args:
+            groups (list): Lista de listas de strings no formato "HH:MM:SS"
+            start_date (datetime): Data inicial a ser combinada com os horários
+
+        Returns:
+            list: Um numpy.ndarray datetime64[us] para cada grupo, na mesma ordem
+        """
+        secs = _hms_to_seconds([t for group in groups for t in group]) if any(groups) else None
+        if secs is None:
+            return [np.array(self.time_to_datetime(group, start_date), dtype='datetime64[us]')
+                    for group in groups]
+
+        arr = np.datetime64(start_date.strftime('%Y-%m-%d'), 's') + secs.astype('timedelta64[s]')
+        result = []
+        inicio = 0
+        for group in groups:
+            fim = inicio + len(group)
+            result.append(_apply_day_rollover(arr[inicio:fim]).astype('datetime64[us]'))
+            inicio = fim
+        return result
 
     def replace_date_in_times(self,time_objects, specific_date):
             """
@@ -503,24 +992,14 @@ class DataObjectFitaDigital:
             Returns:
                 list: Lista de objetos datetime com a data especificada e as horas originais.
             """
-            # Converte a data específica para um objeto datetime
-            date_object = datetime.strptime(specific_date, "%Y-%m-%d")
-
-            # Substitui ano, mês e dia em cada objeto de tempo
-            updated_datetimes = [
-                t.replace(year=date_object.year, month=date_object.month, day=date_object.day)
-                for t in time_objects
-            ]
-            total_time = timedelta()
-            days_elapsed = 0
-            for i in range(1, len(updated_datetimes)):
-                updated_datetimes[i] += timedelta(days=days_elapsed) 
-                if updated_datetimes[i]  < updated_datetimes[i - 1]:
-                    days_elapsed +=1
-                    print(days_elapsed)
-                    updated_datetimes[i] += timedelta(days=1)
-
-            return updated_datetimes
+            if not time_objects:
+                return []
+            # Horário do dia de cada objeto, somado à data específica
+            arr = np.array(time_objects, dtype='datetime64[us]')
+            time_of_day = arr - arr.astype('datetime64[D]')
+            updated = np.datetime64(specific_date, 'D') + time_of_day
+
+            return _apply_day_rollover(updated).astype(object).tolist()
     def compute_statistics(self, phases=None):
         """
         Calcula as estatísticas do ciclo (máximo, mínimo, média e moda) para cada variável.
@@ -566,8 +1045,10 @@ class DataObjectFitaDigital:
 
         if not fases:
             raise ValueError("Lista de fases não fornecida")
-        #filtrando as fases de interesse no body_fita
-        body_fases_filtradas = [x for x in self.body_fita['fase'] if x[1] in fases]
+        # Índice da primeira ocorrência de cada fase, calculado uma única vez
+        fase_idx = {}
+        for idx, fase in enumerate(self.body_fita['fase']):
+            fase_idx.setdefault(fase[1], idx)
         
         estatisticas = {}
         # Para cada fase na lista
@@ -577,28 +1058,23 @@ class DataObjectFitaDigital:
     
             # Calcula a duração entre as fases usando os índices
             try:
-                idx_fase_atual = [f[1] for f in self.body_fita['fase'] ].index(fase_atual)
-                print(f"idx_fase_atual: {idx_fase_atual}, fase_atual: {fase_atual}")
+                idx_fase_atual = fase_idx.get(fase_atual)
                 if idx_fase_atual is None:
-                    error_msg[i] = f"Não foi possível encontrar a fase {fase_atual}"
+                    error_msg.append(f"A fase {fase_atual} não foi encontrada")
                     continue
-                print(f"idx_fase_atual: {idx_fase_atual}")
+                _logger.debug("idx_fase_atual: %s, fase_atual: %s", idx_fase_atual, fase_atual)
                 idx_fase_proxima = None
                 
                 for fproxima in fases[i+1:]:
-                    try:
-                        idx_fase_proxima =  [f[1] for f in self.body_fita['fase']].index(fproxima)
+                    idx_fase_proxima = fase_idx.get(fproxima)
+                    if idx_fase_proxima is not None:
                         fase_proxima = fproxima
                         break
-                    except ValueError as e:
-                        error_msg.append( f"Não foi possível encontrar a próxima fase {fproxima} para {fase_atual}: {str(e)}"  )  
-                        continue
-               
+                    error_msg.append(f"Não foi possível encontrar a próxima fase {fproxima} para {fase_atual}")
                     
-                    
-                print(f"idx_fase_proxima: {idx_fase_proxima}")
+                _logger.debug("idx_fase_proxima: %s", idx_fase_proxima)
                 duration = self.calcular_tempo_entre_fases(idx_fase_atual, idx_fase_proxima)
-                print(f"duration: {duration}")
+                _logger.debug("duration: %s", duration)
            
             except ValueError as e:
                 error_msg.append( f"A fase {fase_atual} não foi encontrada: {str(e)}")
@@ -623,6 +1099,77 @@ class DataObjectFitaDigital:
 
        
             
+    def _materialize_arrays(self, tempos=None, tempos_fase=None):
+        """
+        Monta as medições em colunas NumPy (uma por variável), calculadas uma vez
+        por corpo de fita carregado.
+
+        body_fita['data'] continua sendo a lista de linhas usada pelo restante do
+        módulo; body_arr é a visão colunar consumida pelos cálculos estatísticos.
+
+        Args:
+            tempos (numpy.ndarray, opcional): Horários das medições em datetime64[us],
+                quando já convertidos (ex.: em read_body_fita)
+            tempos_fase (numpy.ndarray, opcional): Horários das fases em datetime64[us]
+
+        Returns:
+            dict: Colunas das medições (ver _arrays_medicoes)
+        """
+        dados = self.body_fita['data']
+        fases = self.body_fita.get('fase')
+        chave = (id(dados), len(dados), id(fases), len(fases or ()))
+        if tempos is None and getattr(self, '_body_arr_key', None) == chave:
+            return self.body_arr
+
+        body_arr = _arrays_medicoes(dados, self.body_fita.get('header_columns', []),
+                                    fases, tempos, tempos_fase)
+        self.body_arr = body_arr
+        self._body_arr_key = chave
+        return body_arr
+
+    def _timestamps_entre_fases(self, fase_inicial, fase_final):
+        """
+        Localiza os horários de início e fim do intervalo entre duas fases.
+
+        O fim é a primeira ocorrência de fase_final e o início a última ocorrência
+        de fase_inicial antes dela, consultadas no índice de fases de body_arr.
+
+        Args:
+            fase_inicial (str): Nome da fase inicial
+            fase_final (str): Nome da fase final
+
+        Returns:
+            tuple: (datetime inicial, datetime final); None onde a fase não foi encontrada
+        """
+        fases = self.body_fita.get('fase') or []
+        fase_index = self._materialize_arrays()['fase_index']
+        posicoes_final = fase_index.get(fase_final) if fase_final != fase_inicial else None
+        if not posicoes_final:
+            return None, None
+        final = posicoes_final[0]
+        posicoes_inicial = fase_index.get(fase_inicial, [])
+        k = bisect_left(posicoes_inicial, final)
+        if k == 0:
+            return None, fases[final][0]
+        return fases[posicoes_inicial[k - 1]][0], fases[final][0]
+
+    def _selecao_entre(self, timestamp_inicial, timestamp_final):
+        """
+        Retorna a seleção das medições com horário entre os dois limites (inclusive).
+
+        Com os horários em ordem crescente (o normal após a virada de dia em
+        time_to_datetime) os limites são achados por busca binária e a seleção é
+        um slice; caso contrário é um array de índices.
+
+        Args:
+            timestamp_inicial (datetime): Limite inicial
+            timestamp_final (datetime): Limite final
+
+        Returns:
+            slice | numpy.ndarray: Seleção aplicável às colunas de body_arr
+        """
+        return _selecao_entre(self._materialize_arrays(), timestamp_inicial, timestamp_final)
+
     def calcular_estatisticas_ciclo_entre_fases(self, fase_inicial=None, fase_final=None):
         """
         Calcula as estatísticas do ciclo (máximo, mínimo, média e moda) para cada variável entre fases específicas.
@@ -653,33 +1200,25 @@ class DataObjectFitaDigital:
             if not self.body_fita or 'data' not in self.body_fita:
                 raise ValueError("Dados da fita não foram carregados")
                 
-            dados = self.body_fita['data']
-            if not dados:
+            if not self.body_fita['data']:
                 raise ValueError("Não há dados de medição disponíveis")
 
+            body_arr = self._materialize_arrays()
+            selecao = slice(None)
+
             # Se fases foram especificadas, filtra os dados entre elas
             if fase_inicial and fase_final:
                 if 'fase' not in self.body_fita:
                     raise ValueError("Dados de fases não disponíveis")
                     
                 # Encontra os timestamps das fases
-                fases = self.body_fita['fase']
-                timestamp_inicial = None
-                timestamp_final = None
-                
-                for fase in fases:
-                    if fase[1] == fase_inicial:
-                        timestamp_inicial = fase[0]
-                    elif fase[1] == fase_final:
-                        timestamp_final = fase[0]
-                        break
+                timestamp_inicial, timestamp_final = self._timestamps_entre_fases(fase_inicial, fase_final)
                 
                 if not timestamp_inicial or not timestamp_final:
                     raise ValueError(f"Fases '{fase_inicial}' e/ou '{fase_final}' não encontradas")
                 
                 # Filtra dados entre as fases
-                dados = [linha for linha in dados 
-                        if timestamp_inicial <= linha[0] <= timestamp_final]
+                selecao = self._selecao_entre(timestamp_inicial, timestamp_final)
                 
             # Inicializa dicionário de estatísticas
             estatisticas = {}
@@ -687,27 +1226,22 @@ class DataObjectFitaDigital:
             # Pega os nomes das colunas, excluindo a coluna de tempo (índice 0)
             colunas = self.body_fita.get('header_columns', [])[1:]
             
-            # Para cada coluna numérica (índice > 0 nos dados)
-            for i, coluna in enumerate(colunas, start=1):
-                # Extrai valores da coluna
-                valores = [linha[i] for linha in dados]
+            # Para cada coluna numérica presente nas medições
+            for coluna in colunas:
+                if coluna not in body_arr['columns']:
+                    continue
+                valores = body_arr['columns'][coluna][selecao]
                 
                 # Calcula estatísticas
-                maximo = max(valores)
-                minimo = min(valores)
-                media = sum(valores) / len(valores)
-                
-                # Calcula a moda
-                from statistics import mode
-                try:
-                    moda = mode(valores)
-                except:
-                    moda = None
+                maximo = valores.max()
+                minimo = valores.min()
+                media = valores.mean()
+                moda = _moda(valores)
                     
                 estatisticas[coluna] = {
-                    'max': round(maximo, 2),
-                    'min': round(minimo, 2),
-                    'media': round(media, 2),
+                    'max': round(float(maximo), 2),
+                    'min': round(float(minimo), 2),
+                    'media': round(float(media), 2),
                     'moda': round(moda, 2) if moda is not None else None
                 }
                 
@@ -734,7 +1268,7 @@ class DataObjectFitaDigital:
 
         Raises:
             ValueError: Se as fases não forem encontradas ou dados inválidos
-            Exception: Para outros erros durante o cálculo
+            IndexError: Se index_temp ou index_eto não existirem nas medições
 
         Notas:
             Implementa o modelo D-value para mortalidade microbiana acumulativa:
@@ -744,122 +1278,122 @@ class DataObjectFitaDigital:
             - t é o tempo de exposição acumulado
             - Volume da câmara é 15m³
         """
-        try:
-            # Verifica se há dados carregados
-            if not self.body_fita or not self.body_fita.get('data'):
-                raise ValueError("Dados da fita não foram carregados")
+        # Verifica se há dados carregados
+        if not self.body_fita or not self.body_fita.get('data'):
+            raise ValueError("Dados da fita não foram carregados")
 
-            # Parâmetros do modelo D-value
-            D_value = 3.8 # Valor D em minutos a 54°C (exemplo)
-            z_value = 50.0  # Valor Z em °C
-            volume_camara = 15.0 # Volume da câmara em m³
-            C_value = 0.0045 # Valor de mudança concetração para reduzir em 1 log
-            C_base = 0.00045 # Concentração de referência
-            temp_base = 50 # Temperatura de referência
-
-            # Filtra dados entre as fases especificadas
-            timestamp_inicial = None
-            timestamp_final = None
+        # Parâmetros do modelo D-value
+        D_value = 3.8 # Valor D em minutos a 54°C (exemplo)
+        z_value = 50.0  # Valor Z em °C
+        volume_camara = 15.0 # Volume da câmara em m³
+        C_value = 0.0045 # Valor de mudança concetração para reduzir em 1 log
+        C_base = 0.00045 # Concentração de referência
+        temp_base = 50 # Temperatura de referência
+
+        # Filtra dados entre as fases especificadas
+        timestamp_inicial, timestamp_final = self._timestamps_entre_fases(fase_inicial, fase_final)
+
+        if not timestamp_inicial or not timestamp_final:
+            raise ValueError(f"Fases '{fase_inicial}' e/ou '{fase_final}' não encontradas")
+
+        # Filtra dados do período
+        body_arr = self._materialize_arrays()
+        selecao = self._selecao_entre(timestamp_inicial, timestamp_final)
+        tempos_periodo = body_arr['time'][selecao]
+
+        if not len(tempos_periodo):
+            raise ValueError("Não foram encontrados dados no período especificado")
+
+        # Índices das colunas
+        if index_temp is None:
+            index_temp = 2  # TCI(Celsius)
+        if index_eto is None:
+            index_eto = 4   # Quantidade de ETO em kg
+        idx_temp = index_temp  # TCI(Celsius)
+        idx_eto = index_eto   # Quantidade de ETO em kg
+
+        # Colunas do período; cada intervalo usa a leitura do seu início
+        inicio_intervalos = body_arr['values'][selecao][:-1]
+        minutos = np.diff(tempos_periodo).astype(np.float64) / 60e6
+
+        # Temperatura no intervalo (values não inclui a coluna de tempo)
+        if index_temp:
+            temps = inicio_intervalos[:, idx_temp - 1]
+        else:
+            temps = np.full(len(inicio_intervalos), 54.0)
+
+        # Calcula concentração de ETO em kg/m³
+        if index_eto:
+            eto_kg = inicio_intervalos[:, idx_eto - 1]
+            # Elimina valores de ETO maiores que 50kg por serem considerados inválidos
+            eto_kg = np.where(eto_kg > 50.0, 0.1, eto_kg)
+            concs = eto_kg * (1.0 / (volume_camara * 1000))
+        else:
+            # Concentração de referência: o fator de concentração do D-value vale 1
+            concs = np.full(len(inicio_intervalos), C_base)
+
+        # Ajusta D-value para temperatura e concentração de ETO e calcula a redução
+        # populacional pelo tempo acumulado (a concentração de referência é 0.00045 kg/m³)
+        populacao = _mortalidade_kernel(minutos, temps, concs, float(N0), D_value, z_value,
+                                        C_value, C_base, float(temp_base))
+
+        # População em cada medição do período (a primeira é N0), em um único array
+        populacoes = np.empty(len(tempos_periodo))
+        populacoes[0] = N0
+        populacoes[1:] = populacao
+
+        # A lista de tuplas é montada só no retorno
+        populacao_ao_longo_do_tempo = list(zip(tempos_periodo.tolist(), populacoes.tolist()))
+
+        # Gera o gráfico se solicitado
+        if plot:
+            from matplotlib.figure import Figure
+            from matplotlib.dates import DateFormatter
+
+            # Figura criada sem o pyplot: não passa pelo backend de interface gráfica
+            # nem fica registrada no gerenciador global de figuras
+            fig = Figure(figsize=(10, 6))
+            ax = fig.subplots()
             
-            for fase in self.body_fita['fase']:
-                if fase[1] == fase_inicial:
-                    timestamp_inicial = fase[0]
-                elif fase[1] == fase_final:
-                    timestamp_final = fase[0]
-                    break
-
-            if not timestamp_inicial or not timestamp_final:
-                raise ValueError(f"Fases '{fase_inicial}' e/ou '{fase_final}' não encontradas")
-
-            # Filtra dados do período
-            dados = [linha for linha in self.body_fita['data'] 
-                    if timestamp_inicial <= linha[0] <= timestamp_final]
-
-            if not dados:
-                raise ValueError("Não foram encontrados dados no período especificado")
-
-            # Inicializa população e tempo acumulado
-            N = N0
-            tempo_acumulado = 0
-            populacao_ao_longo_do_tempo = [(dados[0][0], N)]
-
-            # Índices das colunas
-            if index_temp is None:
-                index_temp = 2  # TCI(Celsius)
-            if index_eto is None:
-                index_eto = 4   # Quantidade de ETO em kg
-            idx_temp = index_temp  # TCI(Celsius)
-            idx_eto = index_eto   # Quantidade de ETO em kg
-
-            # Calcula mortalidade acumulativa para cada intervalo
-            for i in range(1, len(dados)):
-                # Acumula o tempo em minutos
-                tempo_acumulado += (dados[i][0] - dados[i-1][0]).total_seconds() / 60
-                
-                # Temperatura média no intervalo
-                if index_temp:
-                    temp = dados[i-1][idx_temp]
-                    
-                else:
-                    temp = 54
-                
-                # Calcula concentração de ETO em kg/m³
-                if index_eto:
-                    eto_kg = dados[i-1][idx_eto]
-                    # Elimina valores de ETO maiores que 50kg por serem considerados inválidos
-                    if eto_kg > 50:
-                        eto_kg = 0.1
-                    C = eto_kg / (volume_camara * 1000)
-                   
-                else:
-                    C = C_base
-                
-                # Ajusta D-value para temperatura atual usando z-value e concentração de ETO
-                # A concentração de referência é 0.00045 kg/m³
-                D_temp = D_value * 10**((temp_base - temp)/z_value) *10**((C_base - C)/C_value)
-                
-                # Calcula redução populacional usando D-value e tempo acumulado
-                log_reducao = tempo_acumulado/D_temp
-                N = N0 * (10**(-log_reducao))
-                
-                # Armazena resultado
-                populacao_ao_longo_do_tempo.append((dados[i][0], N))
-
-            # Gera o gráfico se solicitado
-            if plot:
-                import matplotlib.pyplot as plt
-                from matplotlib.dates import DateFormatter
+            # Plota os dados em escala logarítmica no eixo y, direto dos arrays do período
+            ax.semilogy(tempos_periodo, populacoes, 'b-', label='População microbiana acumulada')
+            
+            # Configura o eixo x para mostrar datas formatadas
+            ax.xaxis.set_major_formatter(DateFormatter('%H:%M:%S'))
+            ax.tick_params(axis='x', labelrotation=45)
+            
+            # Adiciona rótulos e título
+            ax.set_xlabel('Tempo')
+            ax.set_ylabel('População Acumulada (UFC/unidade) - Escala Log')
+            ax.set_title('Mortalidade Microbiana Acumulativa ao Longo do Tempo')
+            ax.grid(True)
+            ax.legend()
+            
+            # Ajusta o layout
+            fig.tight_layout()
+            
+            return populacao_ao_longo_do_tempo, fig
+        
+        return populacao_ao_longo_do_tempo
 
-                # Separa os dados em listas de x e y
-                tempos = [p[0] for p in populacao_ao_longo_do_tempo]
-                populacoes = [p[1] for p in populacao_ao_longo_do_tempo]
 
-                # Cria a figura e eixos
-                fig, ax = plt.subplots(figsize=(10, 6))
-                
-                # Plota os dados em escala logarítmica no eixo y
-                ax.semilogy(tempos, populacoes, 'b-', label='População microbiana acumulada')
-                
-                # Configura o eixo x para mostrar datas formatadas
-                ax.xaxis.set_major_formatter(DateFormatter('%H:%M:%S'))
-                plt.xticks(rotation=45)
-                
-                # Adiciona rótulos e título
-                ax.set_xlabel('Tempo')
-                ax.set_ylabel('População Acumulada (UFC/unidade) - Escala Log')
-                ax.set_title('Mortalidade Microbiana Acumulativa ao Longo do Tempo')
-                ax.grid(True)
-                ax.legend()
-                
-                # Ajusta o layout
-                plt.tight_layout()
-                
-                return populacao_ao_longo_do_tempo, fig
-            
-            return populacao_ao_longo_do_tempo
+def _read_fita_file(reader_cls, path, size_header=None):
+    """
+    Lê o cabeçalho e o corpo de uma fita; executado nos processos de process_directory.
 
-        except ValueError as e:
-            raise ValueError(f"Erro no cálculo de mortalidade: {str(e)}")
-        except Exception as e:
-            raise Exception(f"Erro inesperado no cálculo de mortalidade: {str(e)}")
+    Args:
+        reader_cls (type): Classe do leitor de fita
+        path (str): Caminho completo do arquivo
+        size_header (int): Tamanho do cabeçalho repassado a register_reader_fita
 
+    Returns:
+        dict: path, header, body e error (ver process_directory)
+    """
+    try:
+        do = DataObjectFitaDigital(os.path.dirname(path) or '.')
+        do.register_reader_fita(reader_cls(path), size_header)
+        header, body = do.read_all_fita_fast()
+        return {'path': path, 'header': header, 'body': body, 'error': None}
+    except Exception as e:
+        _logger.error("Erro ao ler a fita %s: %s", path, e)
+        return {'path': path, 'header': None, 'body': None, 'error': str(e)}
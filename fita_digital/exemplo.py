@@ -29,6 +29,11 @@ do.set_size_header(25)
 #do.set_size_header(20)
 print(do.reader_fita.read_header())
 print(do.read_all_fita())
+
+# Lendo em paralelo, um processo por fita, todas as fitas do diretório (somente fora do Odoo)
+if __name__ == '__main__':
+    resultados = do.process_directory(ReaderFitaDigitalSerconJpLac210, size_header=25)
+    print([resultado['path'] for resultado in resultados if resultado['error']])
 #print(do.compute_statistics(phases=['INICIO DE PRE-LAVAGEM','INICIO DE ENXAGUE']))
 #cycle_graph = do.make_graph()
 
@@ -1,11 +1,150 @@
 from abc import ABC, abstractmethod
+import functools
+import io
 import os
+import re
 from datetime import datetime
+from itertools import islice
 import logging
 
+import numpy as np
+
 _logger = logging.getLogger(__name__)
 
+# A moda e as colunas NumPy das medições são as mesmas do DataObjectFitaDigital; o
+# import absoluto atende ao uso dos pacotes como nível superior (ex.: exemplo.py),
+# fora do pacote fita_digital
+try:
+    from ..data_object.dataobject_fita_digital import _moda, _arrays_medicoes, _selecao_entre
+except ImportError:
+    from data_object.dataobject_fita_digital import _moda, _arrays_medicoes, _selecao_entre
+
+
+def _estatisticas_colunas(valores, colunas):
+    """
+    Calcula máximo, mínimo, média e moda de cada coluna numérica das medições.
+
+    As reduções são feitas por coluna sobre a matriz NumPy, sem percorrer as
+    linhas em Python.
+
+    Args:
+        valores (numpy.ndarray): Matriz (linhas x colunas) com os valores medidos
+        colunas (list): Nomes das colunas numéricas, na ordem da matriz
+
+    Returns:
+        dict: {coluna: {'max': float, 'min': float, 'media': float, 'moda': float}}
+    """
+    estatisticas = {}
+    if not len(valores) or not colunas:
+        return estatisticas
+
+    maximos = valores.max(axis=0).tolist()
+    minimos = valores.min(axis=0).tolist()
+    medias = valores.mean(axis=0).tolist()
+
+    for i, coluna in enumerate(colunas[:valores.shape[1]]):
+        moda = _moda(valores[:, i])
+        estatisticas[coluna] = {
+            'max': round(maximos[i], 2),
+            'min': round(minimos[i], 2),
+            'media': round(medias[i], 2),
+            'moda': round(moda, 2) if moda is not None else None
+        }
+    return estatisticas
+
+
+def _segundos_entre(inicio, fim):
+    """
+    Calcula os segundos decorridos entre dois horários de fase.
+
+    Os horários podem ser datetimes (já convertidos pelo DataObjectFitaDigital) ou as
+    strings HH:MM:SS / HH:MM lidas da fita; nesse caso um horário final menor que o
+    inicial indica a virada do dia.
+
+    Args:
+        inicio (datetime | str): Horário inicial
+        fim (datetime | str): Horário final
+
+    Returns:
+        int: Segundos decorridos
+    """
+    if isinstance(inicio, str) and isinstance(fim, str):
+        segundos = _hora_em_segundos(fim) - _hora_em_segundos(inicio)
+        return segundos + 86400 if segundos < 0 else segundos
+    return int((fim - inicio).total_seconds())
+
+
+def _hora_em_segundos(hora):
+    """
+    Converte um horário HH:MM:SS ou HH:MM em segundos do dia.
+
+    Args:
+        hora (str): Horário
+
+    Returns:
+        int: Segundos do dia
+    """
+    partes = [int(parte) for parte in hora.split(':')]
+    return partes[0] * 3600 + partes[1] * 60 + (partes[2] if len(partes) > 2 else 0)
+
+
+def _parse_data(valor):
+    """
+    Converte a data DD-MM-AAAA do cabeçalho em datetime, como
+    datetime.strptime(valor, '%d-%m-%Y'), sem interpretar o formato a cada chamada.
+
+    Valores fora do formato simples são repassados ao strptime, que mantém a mesma
+    validação e a mesma mensagem de erro.
+
+    Args:
+        valor (str): Data no formato DD-MM-AAAA
+
+    Returns:
+        datetime: Data convertida
+
+    Raises:
+        ValueError: Se a data for inválida
+    """
+    partes = valor.split('-')
+    if len(partes) == 3:
+        dia, mes, ano = partes
+        if (0 < len(dia) <= 2 and 0 < len(mes) <= 2 and len(ano) == 4
+                and (dia + mes + ano).isascii() and (dia + mes + ano).isdigit()):
+            return datetime(int(ano), int(mes), int(dia))
+    return datetime.strptime(valor, '%d-%m-%Y')
+
+
+def cache_header(read_header):
+    """
+    Decorador para read_header dos leitores concretos: guarda o cabeçalho lido e o
+    reaproveita nas chamadas seguintes, enquanto size_header não mudar.
+
+    Cada chamada recebe uma cópia do dicionário, de modo que alterações feitas pelo
+    chamador não afetam o cache.
+
+    Args:
+        read_header (callable): Método read_header do leitor
+
+    Returns:
+        callable: Método read_header com cache
+    """
+    @functools.wraps(read_header)
+    def wrapper(self):
+        if self._header_cache is None or self._header_cache_size != self.size_header:
+            self._header_cache = read_header(self)
+            self._header_cache_size = self.size_header
+        return dict(self._header_cache)
+    return wrapper
+
+
+# Linha de títulos das colunas de cada fase em formatar_estatisticas_colunas
+_CABECALHO_ESTATISTICAS = f"\n{'Grandeza':<12} {'Min':>10} {'Max':>10} {'Med':>10} {'Moda':>10}"
+
+
 class HeaderFields:
+    # Os campos são constantes de classe; as instâncias não têm atributos próprios
+    __slots__ = ()
+
     date_key = "Data:"
     time_key = "Hora:"
     equipment_key = "Equipamento:"
@@ -13,6 +152,46 @@ class HeaderFields:
     cycle_code_key = "Cod. ciclo:"
     selected_cycle_key = "Ciclo Selecionado:"
 
+    # Todos os campos acima, usados na leitura do cabeçalho
+    ALL = (date_key, time_key, equipment_key, operator_key, cycle_code_key, selected_cycle_key)
+    # Localiza qualquer um dos campos em uma única busca por linha
+    RE = re.compile('|'.join(re.escape(field) for field in ALL))
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Recalcula ALL e RE para subclasses que alteram ou acrescentam campos, a menos
+        que a própria subclasse os defina.
+        """
+        super().__init_subclass__(**kwargs)
+        if 'ALL' not in cls.__dict__:
+            nomes = dict.fromkeys(nome for klass in reversed(cls.__mro__)
+                                  for nome in vars(klass) if nome.endswith('_key'))
+            cls.ALL = tuple(getattr(cls, nome) for nome in nomes)
+        if 'RE' not in cls.__dict__:
+            cls.RE = re.compile('|'.join(
+                re.escape(field) for field in sorted(cls.ALL, key=len, reverse=True)))
+
+def _header_fields_re(header_fields):
+    """
+    Obtém o padrão que localiza os campos do cabeçalho em uma linha.
+
+    Usa o padrão RE do objeto de campos quando existir; para outros objetos, os
+    campos são obtidos por reflexão, uma única vez por objeto.
+
+    Args:
+        header_fields: Objeto com os campos do cabeçalho (ver HeaderFields)
+
+    Returns:
+        re.Pattern: Padrão com a alternância dos campos
+    """
+    header_fields_re = getattr(header_fields, 'RE', None)
+    if header_fields_re is None:
+        header_fields_names = [getattr(header_fields, attr) for attr in dir(header_fields) if not attr.startswith('_')]
+        header_fields_re = re.compile('|'.join(
+            re.escape(field) for field in sorted(header_fields_names, key=len, reverse=True)))
+    return header_fields_re
+
+
 class ReaderFitaDigitalInterface(ABC):
     """
     Interface para leitura de fitas digitais de equipamentos.
@@ -26,6 +205,15 @@ class ReaderFitaDigitalInterface(ABC):
         header_fields (list): Lista dos campos do cabeçalho da fita digital
     """
 
+    # Atributos fixos do leitor; sem __dict__ o acesso a eles é feito por deslocamento
+    __slots__ = (
+        'file_name', '_file_stem', 'size_header', 'lines_file', 'lines_body_raw', 'body',
+        'header_fields', 'state_finalized_keys', 'state_aborted_keys',
+        '_header_cache', '_header_cache_size', '_header_fields_re',
+        '_header_lines', '_body_lines', '_lines_key',
+        '_body_arr', '_body_arr_key',
+    )
+
     def __init__(self,full_path_file):
         """
         Inicializa o leitor de fita digital.
@@ -36,9 +224,25 @@ class ReaderFitaDigitalInterface(ABC):
         if not full_path_file:
             raise ValueError("full_path_file não definido ao instanciar o leitor de fita digital")
         self.file_name = full_path_file
+        # Nome do arquivo sem diretório e sem a extensão .txt, usado nos relatórios
+        self._file_stem = os.path.basename(full_path_file).replace(".txt", "")
         
         # Tamanho padrão do cabeçalho em bytes
         self.size_header = 25
+
+        # Cabeçalho já lido (ver cache_header) e o size_header usado na leitura
+        self._header_cache = None
+        self._header_cache_size = None
+
+        # Colunas NumPy e índice de fases de um body (ver _arrays_body)
+        self._body_arr = None
+        self._body_arr_key = None
+
+        # Fatias de cabeçalho e corpo de lines_file (ver _ensure_loaded) e a chave
+        # (lines_file, size_header) com que foram obtidas
+        self._header_lines = None
+        self._body_lines = None
+        self._lines_key = None
         
         # Lista que armazenará todas as linhas do arquivo após a leitura
         self.lines_file = []
@@ -54,6 +258,7 @@ class ReaderFitaDigitalInterface(ABC):
         # Instância da classe que define as chaves do cabeçalho
         # Facilita o acesso e manutenção das chaves utilizadas no cabeçalho
         self.header_fields = HeaderFields()
+        self._header_fields_re = _header_fields_re(self.header_fields)
 
         self.state_finalized_keys = ["CICLO FINALIZADO", "CICLO CONCLUIDO","AERACAO"]
         self.state_aborted_keys = ["CICLO ABORTADO"]
@@ -69,15 +274,41 @@ class ReaderFitaDigitalInterface(ABC):
         Returns:
             str: Conteúdo do arquivo
             
+        Raises:
+            FileNotFoundError: Se o arquivo não for encontrado
+            IOError: Se houver erro na leitura do arquivo
+        """
+        self.lines_file = self._read_lines()
+        return self.lines_file
+
+    def _read_lines(self, max_lines=None):
+        """
+        Lê as linhas do arquivo de fita.
+
+        O arquivo completo é lido em binário e os caracteres nulos gravados pelos
+        equipamentos são removidos de uma vez, com bytes.translate, antes da decodificação.
+        Na leitura parcial (max_lines) eles são removidos das linhas lidas, de modo que
+        as linhas entregues aos leitores nunca contêm caracteres nulos.
+
+        Args:
+            max_lines (int, opcional): Número máximo de linhas a ler; None lê o arquivo todo
+
+        Returns:
+            list: Linhas lidas do arquivo
+
         Raises:
             FileNotFoundError: Se o arquivo não for encontrado
             IOError: Se houver erro na leitura do arquivo
         """
         try:
-            print(f"Lendo o arquivo: {self.file_name}")
-            with open(self.file_name, 'r') as file:
-                self.lines_file = file.readlines()
-                return self.lines_file
+            _logger.debug("Lendo o arquivo: %s", self.file_name)
+            if max_lines is not None:
+                with open(self.file_name, 'r', encoding='utf-8', errors='replace') as file:
+                    return [line.replace('\x00', '') for line in islice(file, max_lines)]
+            with open(self.file_name, 'rb') as file:
+                text = file.read().translate(None, b'\x00').decode('utf-8', 'replace')
+            # StringIO com newline=None traduz as quebras de linha como a leitura em modo texto
+            return io.StringIO(text, newline=None).readlines()
         except FileNotFoundError:
             raise FileNotFoundError(f"Arquivo não encontrado: {self.file_name}")
         except IOError as e:
@@ -87,29 +318,47 @@ class ReaderFitaDigitalInterface(ABC):
         """
         Lê as informações do arquivo de fita digital.
         """
+        # Um único stat fornece as datas de criação e modificação
+        st = os.stat(self.file_name)
         return {
             'file_name': os.path.splitext(os.path.basename(self.file_name))[0],
-            'create_date': datetime.fromtimestamp(os.path.getctime(self.file_name)).strftime('%d-%m-%Y %H:%M:%S'),
-            'change_date': datetime.fromtimestamp(os.path.getmtime(self.file_name)).strftime('%d-%m-%Y %H:%M:%S')
+            'create_date': datetime.fromtimestamp(st.st_ctime).strftime('%d-%m-%Y %H:%M:%S'),
+            'change_date': datetime.fromtimestamp(st.st_mtime).strftime('%d-%m-%Y %H:%M:%S')
         }
-    def read_header_file_content(self):
+    def _ensure_loaded(self):
         """
-        Lê o conteúdo do arquivo de fita digital.
+        Lê o arquivo, se ainda não foi lido, e separa as linhas de cabeçalho e corpo.
 
+        As fatias são calculadas uma única vez e reaproveitadas enquanto lines_file e
+        size_header não mudarem.
         """
         if self.lines_file == []:
             self.read_file()
 
-        return self.lines_file[:self.size_header]
-    def read_body_file_content(self):
+        key = (id(self.lines_file), len(self.lines_file), self.size_header)
+        if self._lines_key != key:
+            self._header_lines = self.lines_file[:self.size_header]
+            self._body_lines = self.lines_file[self.size_header:]
+            self._lines_key = key
+
+    def read_header_file_content(self):
         """
         Lê o conteúdo do arquivo de fita digital.
 
         """
         if self.lines_file == []:
-            self.read_file()
+            # Sem o arquivo completo em memória, lê só as linhas do cabeçalho
+            return self._read_lines(self.size_header)
+
+        self._ensure_loaded()
+        return self._header_lines
+    def read_body_file_content(self):
+        """
+        Lê o conteúdo do arquivo de fita digital.
 
-        return self.lines_file[self.size_header:]   
+        """
+        self._ensure_loaded()
+        return self._body_lines
 
     @abstractmethod
     def read_header(self):
@@ -142,24 +391,28 @@ class ReaderFitaDigitalInterface(ABC):
         # Obtém o conteúdo do arquivo
         file_content = self.read_header_file_content()
         
+        # Padrão com os campos do cabeçalho, montado em __init__/set_header_fields
+        header_fields_re = self._header_fields_re
+        
         # Itera sobre cada linha do conteúdo do arquivo
         for line in file_content:
-            # Remove caracteres nulos e espaços em branco do início e fim da linha
-            line = line.replace('\x00', '').strip()
-            
-            # Obtém todos os nomes dos campos do cabeçalho definidos na classe
-            header_fields_names = [getattr(self.header_fields, attr) for attr in dir(self.header_fields) if not attr.startswith('_')]
+            # Remove espaços em branco do início e fim da linha (os caracteres nulos já
+            # foram removidos na leitura do arquivo)
+            line = line.strip()
             
-            # Itera sobre cada campo do cabeçalho
-            for field in header_fields_names:
-                
-                
-                # Se o campo for encontrado na linha, extrai seu valor
-                if field in line:
-                    # Divide a linha no campo e pega o valor após ele, removendo espaços
-                    header_values[field] = line.split(field)[1].strip()
+            # Localiza os campos do cabeçalho presentes na linha
+            encontrados = set()
+            for match in header_fields_re.finditer(line):
+                field = match.group()
+                if field in encontrados:
+                    continue
+                encontrados.add(field)
+                # O valor é o texto após o campo, até uma nova ocorrência do mesmo campo
+                inicio = match.end()
+                fim = line.find(field, inicio)
+                header_values[field] = (line[inicio:fim] if fim != -1 else line[inicio:]).strip()
 
-        print(f"header_values: {header_values}")
+        _logger.debug("header_values: %s", header_values)
         return header_values
     
     @abstractmethod
@@ -180,6 +433,7 @@ class ReaderFitaDigitalInterface(ABC):
             list: Lista atualizada dos campos do cabeçalho
         """
         self.header_fields = fields_name
+        self._header_fields_re = _header_fields_re(fields_name)
         return self.header_fields
 
     @abstractmethod
@@ -213,18 +467,29 @@ class ReaderFitaDigitalInterface(ABC):
         # Processa o cabeçalho
         body_dict = self._process_header_line(lines_body, body_dict)
         
-        for line in lines_body[1:]:
+        # Cada linha é limpa uma única vez aqui; os métodos _process_* recebem a
+        # linha já sem espaços nas pontas
+        process_phase_line = self._process_phase_line
+        process_body_line = self._process_body_line
+        # Como antes, self.body só é atualizado quando há alguma linha que não é de fase
+        atualiza_body = False
+
+        # Percorre as linhas após a de colunas sem copiar a lista do corpo
+        for line in islice(lines_body, 1, None):
 
             line = line.strip()
             
             # Verifica se é uma linha de fase
-            is_phase, body_dict = self._process_phase_line(line, body_dict)
+            is_phase, body_dict = process_phase_line(line, body_dict)
             
             if is_phase:
                 continue
                     
             # Processa linha de dados
-            body_dict = self._process_body_line(line, body_dict)
+            body_dict = process_body_line(line, body_dict)
+            atualiza_body = True
+
+        if atualiza_body:
             self.body = body_dict
         return self.body
 
@@ -255,10 +520,9 @@ class ReaderFitaDigitalInterface(ABC):
         """
         fases_filtradas = []
         if self.body.get('fase'):
-            # Filtra as fases que estão na lista de fases desejadas
+            # Filtra as fases que estão na lista de fases desejadas (busca em conjunto)
+            fases = fases if isinstance(fases, (set, frozenset)) else set(fases)
             fases_filtradas = [fase[1] for fase in self.body['fase'] if fase[1] in fases]
-        else:
-            fases_filtradas = []
         return fases_filtradas
         
     def get_parametros(self):
@@ -274,6 +538,27 @@ class ReaderFitaDigitalInterface(ABC):
             parametros = self.body['header_columns'][1:]
         return parametros
 
+    def _arrays_body(self, body):
+        """
+        Obtém as colunas NumPy das medições e o índice de fases de um body.
+
+        As colunas são montadas uma única vez (ver _arrays_medicoes) e reaproveitadas
+        enquanto as listas de medições e de fases não mudarem.
+
+        Args:
+            body (dict): Corpo da fita com 'data', 'fase' e 'header_columns'
+
+        Returns:
+            dict: Colunas das medições (ver _arrays_medicoes)
+        """
+        dados = body.get('data') or []
+        fases = body.get('fase') or []
+        key = (id(dados), len(dados), id(fases), len(fases))
+        if self._body_arr_key != key:
+            self._body_arr = _arrays_medicoes(dados, body.get('header_columns', []), fases)
+            self._body_arr_key = key
+        return self._body_arr
+
     @abstractmethod
     def make_graph(self, header, body):    
         pass
@@ -310,53 +595,36 @@ class ReaderFitaDigitalInterface(ABC):
        
         error_msg = []
         duration = None
-        print(f"header: {header}")
-        print(f"body: {body}")
-        print(f"phases: {phases}")
+        _logger.debug("header: %s", header)
+        _logger.debug("body: %s", body)
+        _logger.debug("phases: %s", phases)
         if not body or 'data' not in body:
             raise ValueError("Dados da fita não foram carregados")
 
         if not phases:
             raise ValueError("Lista de fases não fornecida")
-        #filtrando as fases de interesse no body_fita
-        body_fases_filtradas = [x for x in body['fase'] if x[1] in phases]
+        # Índice nome da fase -> posições, montado uma única vez para todas as buscas
+        indice = self._arrays_body(body)['fase_index']
         
         estatisticas = {}
         # Para cada fase na lista
         for i in range(len(phases)-1):
             fase_atual = phases[i]
-            fase_proxima = None
     
-            # Calcula a duração entre as fases usando os índices
-            try:
-                idx_fase_atual = [f[1] for f in body['fase'] ].index(fase_atual)
-                print(f"idx_fase_atual: {idx_fase_atual}, fase_atual: {fase_atual}")
-                if idx_fase_atual is None:
-                    error_msg[i] = f"Não foi possível encontrar a fase {fase_atual}"
-                    continue
-                print(f"idx_fase_atual: {idx_fase_atual}")
-                idx_fase_proxima = None
-
-                for fproxima in phases[i+1:]:
-                    try:
-                        idx_fase_proxima =  [f[1] for f in body['fase']].index(fproxima)
-                        fase_proxima = fproxima
-                        break
-                    except ValueError as e:
-                        error_msg.append( f"Não foi possível encontrar a próxima fase {fproxima} para {fase_atual}: {str(e)}"  )  
-                        continue
-               
-                    
-                    
-                print(f"idx_fase_proxima: {idx_fase_proxima}")
-                duration = self.calcular_tempo_entre_fases(fase_atual, fproxima)
-                print(f"duration: {duration}")
-           
-            except ValueError as e:
-                error_msg.append( f"A fase {fase_atual} não foi encontrada: {str(e)}")
+            idx_fase_atual = indice.get(fase_atual)
+            if idx_fase_atual is None:
+                error_msg.append(f"A fase {fase_atual} não foi encontrada")
                 continue
-            except Exception as e:
-                error_msg.append( f"Erro ao calcular estatísticas do ciclo {fase_atual}: {str(e)}")
+            _logger.debug("idx_fase_atual: %s, fase_atual: %s", idx_fase_atual, fase_atual)
+
+            # Próxima fase da lista que existe na fita
+            fase_proxima = None
+            for fproxima in phases[i+1:]:
+                if fproxima in indice:
+                    fase_proxima = fproxima
+                    break
+                error_msg.append(f"Não foi possível encontrar a próxima fase {fproxima} para {fase_atual}")
+            _logger.debug("idx_fase_proxima: %s", indice.get(fase_proxima))
                 
             # Calcula as estatísticas entre as fases
             if fase_proxima is None:
@@ -378,25 +646,27 @@ class ReaderFitaDigitalInterface(ABC):
         """
         Formata o dicionário de estatísticas do ciclo em colunas alinhadas.
         """
-        print(f"statistics: {statistics}")
-        linhas = [f'### Estatísticas do Ciclo {self.file_name.split("/")[-1].replace(".txt", "")}']
+        _logger.debug("statistics: %s", statistics)
+        buf = io.StringIO()
+        w = buf.write
+        w(f'### Estatísticas do Ciclo {self._file_stem}')
         for fase, dados in statistics.items():
             minutos, segundos = dados['Duration'].split(':')
-            linhas.append(f"## {fase.upper()} - {minutos} min {segundos} seg\n")
-            linhas.append(f"{'Grandeza':<12} {'Min':>10} {'Max':>10} {'Med':>10} {'Moda':>10}")
+            w(f"\n## {fase.upper()} - {minutos} min {segundos} seg\n")
+            w(_CABECALHO_ESTATISTICAS)
             for var, valores in dados.items():
                 if var == 'Duration':
                     continue
                 if isinstance(valores, dict):
-                    linhas.append(
-                        f"{var:<12} "
+                    w(
+                        f"\n{var:<12} "
                         f"{str(valores.get('min', '')):>10} "
                         f"{str(valores.get('max', '')):>10} "
                         f"{str(valores.get('media', '')):>10} "
                         f"{str(valores.get('moda', '')):>10}"
                     )
-            linhas.append("")  # Linha em branco entre fases
-        return '\n'.join(linhas)
+            w("\n")  # Linha em branco entre fases
+        return buf.getvalue()
 
     
     def calcular_tempo_entre_fases(self, fase_inicio, fase_fim):
@@ -416,15 +686,15 @@ class ReaderFitaDigitalInterface(ABC):
                 raise ValueError("Fases não encontradas no body.")
 
             fases = self.body['fase']
-            # Busca os datetimes das fases
-            inicio = next((f[0] for f in fases if f[1] == fase_inicio), None)
-            fim = next((f[0] for f in fases if f[1] == fase_fim), None)
+            # Busca os horários das fases (datetimes ou strings da fita)
+            indice = self._arrays_body(self.body)['fase_index']
+            inicio = fases[indice[fase_inicio][0]][0] if fase_inicio in indice else None
+            fim = fases[indice[fase_fim][0]][0] if fase_fim in indice else None
 
             if not inicio or not fim:
                 raise ValueError(f"Fase(s) '{fase_inicio}' ou '{fase_fim}' não encontrada(s).")
 
-            tempo_decorrido = fim - inicio
-            total_segundos = int(tempo_decorrido.total_seconds())
+            total_segundos = _segundos_entre(inicio, fim)
             minutos = total_segundos // 60
             segundos = total_segundos % 60
             return f"{minutos:02d}:{segundos:02d}"
@@ -487,40 +757,17 @@ class ReaderFitaDigitalInterface(ABC):
                 if not timestamp_inicial or not timestamp_final:
                     raise ValueError(f"Fases '{fase_inicial}' e/ou '{fase_final}' não encontradas")
                 
-                # Filtra dados entre as fases
-                dados = [linha for linha in dados 
-                        if timestamp_inicial <= linha[0] <= timestamp_final]
-                
-            # Inicializa dicionário de estatísticas
-            
-            
             # Pega os nomes das colunas, excluindo a coluna de tempo (índice 0)
             colunas = body.get('header_columns', [])[1:]
-            
-            # Para cada coluna numérica (índice > 0 nos dados)
-            for i, coluna in enumerate(colunas, start=1):
-                # Extrai valores da coluna
-                valores = [linha[i] for linha in dados]
-                if len(valores) == 0:
-                    continue
-                # Calcula estatísticas
-                maximo = max(valores)
-                minimo = min(valores)
-                media = sum(valores) / len(valores)
-                
-                # Calcula a moda
-                from statistics import mode
-                try:
-                    moda = mode(valores)
-                except:
-                    moda = None
-                    
-                estatisticas[coluna] = {
-                    'max': round(maximo, 2),
-                    'min': round(minimo, 2),
-                    'media': round(media, 2),
-                    'moda': round(moda, 2) if moda is not None else None
-                }
+            body_arr = self._arrays_body(body)
+            valores = body_arr['values']
+
+            # Filtra dados entre as fases
+            if fase_inicial and fase_final:
+                valores = valores[_selecao_entre(body_arr, timestamp_inicial, timestamp_final)]
+
+            # Calcula as estatísticas de cada coluna numérica
+            estatisticas = _estatisticas_colunas(valores, colunas)
                 
             return estatisticas
             
@@ -530,39 +777,3 @@ class ReaderFitaDigitalInterface(ABC):
         except Exception as e:
             _logger.error(f"Erro ao calcular estatísticas entre as fases do ciclo: {str(e)}")
             return estatisticas
-
-    def calcular_tempo_entre_fases(self, fase_inicio, fase_fim):
-        """
-        Calcula o tempo decorrido entre duas fases do ciclo.
-
-        Args:
-            fase_inicio (str): Nome da fase inicial
-            fase_fim (str): Nome da fase final
-
-        Returns:
-            str: Tempo decorrido no formato mm:ss
-        """
-        try:
-            # Garante que as fases existem no body
-            if 'fase' not in self.body or not isinstance(self.body['fase'], list):
-                raise ValueError("Fases não encontradas no body.")
-
-            fases = self.body['fase']
-            # Busca os datetimes das fases
-            inicio = next((f[0] for f in fases if f[1] == fase_inicio), None)
-            fim = next((f[0] for f in fases if f[1] == fase_fim), None)
-
-            if not inicio or not fim:
-                raise ValueError(f"Fase(s) '{fase_inicio}' ou '{fase_fim}' não encontrada(s).")
-
-            tempo_decorrido = fim - inicio
-            total_segundos = int(tempo_decorrido.total_seconds())
-            minutos = total_segundos // 60
-            segundos = total_segundos % 60
-            return f"{minutos:02d}:{segundos:02d}"
-        except Exception as e:
-            return f"Erro: {str(e)}"
-    
-    
-       
-
@@ -1,9 +1,61 @@
-from .reader_fita_digital import ReaderFitaDigitalInterface
-import re
-from datetime import datetime
+from .reader_fita_digital import ReaderFitaDigitalInterface, cache_header, _parse_data
+from itertools import islice
+from string import ascii_letters, digits
 import logging
 _logger = logging.getLogger(__name__)
 
+# Caracteres aceitos no nome de uma fase (além dos espaços entre as palavras)
+_PHASE_CHARS = frozenset(ascii_letters + digits + '-')
+
+
+def _is_number(token):
+    """
+    Verifica se o token é um valor numérico da fita: sinal opcional, dígitos e parte decimal opcional.
+
+    Args:
+        token (str): Token a ser verificado
+
+    Returns:
+        bool: True se o token é um número
+    """
+    if token[:1] == '-':
+        token = token[1:]
+    inteiro, _, decimal = token.partition('.')
+    return inteiro.isdecimal() and (not decimal or decimal.isdecimal())
+
+
+def _classify(line):
+    """
+    Classifica uma linha (já sem espaços nas pontas) do corpo da fita AFR13.
+
+    Substitui as expressões regulares por verificações de estrutura: a linha deve
+    começar com a hora HH:MM:SS seguida de espaço e, depois, de valores numéricos
+    (medição) ou de um texto com letras, dígitos, espaços e hífens (fase). Como nas
+    expressões anteriores, a fase é testada antes da medição.
+
+    Args:
+        line (str): Linha a ser classificada
+
+    Returns:
+        tuple: ('phase', [hora, fase]), ('data', partes da linha) ou ('skip', None)
+
+    Exemplo:
+        >>> _classify('10:15:00 ESTERILIZACAO')
+        ('phase', ['10:15:00', 'ESTERILIZACAO'])
+        >>> _classify('10:15:01 1.20 55.3')
+        ('data', ['10:15:01', '1.20', '55.3'])
+    """
+    if (len(line) < 10 or line[2] != ':' or line[5] != ':' or not line[8].isspace()
+            or not (line[:2] + line[3:5] + line[6:8]).isdecimal()):
+        return 'skip', None
+
+    parts = line.split()
+    if all(_PHASE_CHARS.issuperset(part) for part in parts[1:]):
+        return 'phase', [parts[0], line[9:].strip()]
+    if all(_is_number(part) for part in parts[1:]):
+        return 'data', parts
+    return 'skip', None
+
 
 
 class ReaderFitaDigitalAfr13(ReaderFitaDigitalInterface):
@@ -18,6 +70,8 @@ class ReaderFitaDigitalAfr13(ReaderFitaDigitalInterface):
         size_header (int): Tamanho do cabeçalho em linhas
     """
 
+    __slots__ = ()
+
     def __init__(self, full_path_file):
         """
         Inicializa o leitor de fita AFR.
@@ -59,25 +113,20 @@ class ReaderFitaDigitalAfr13(ReaderFitaDigitalInterface):
         Returns:
             dict: Dicionário atualizado com os dados da linha processada
         """
+        # Aceita hora seguida de um ou mais valores numéricos separados por espaços
+        tipo, valores = _classify(line.strip())
+        
+        if tipo != 'data':
+            return body_dict
+
+        # _classify já validou os valores; um único try cobre a conversão da linha toda
         try:
-            # Regex para validar linha com hora e valores numéricos
-            # Aceita hora seguida de um ou mais valores numéricos separados por espaços
-            padrao = r'^(\d{2}:\d{2}:\d{2})(?:\s+(-?\d+\.?\d*))+$'
-            match = re.match(padrao, line.strip())
-            
-            if not match:
-                return body_dict
-                
-            valores = line.split()
-            medicao = [
-                float(valor) if i > 0 else valor
-                for i, valor in enumerate(valores)
-            ]
-            body_dict['data'].append(medicao)
-            
-        except Exception as e:
-            print(f"Erro ao processar linha de medição: {str(e)}")
-            
+            medicao = [valores[0], *map(float, valores[1:])]
+        except ValueError as e:
+            _logger.error(f"Erro ao processar linha de medição: {str(e)}")
+            return body_dict
+
+        body_dict['data'].append(medicao)
         return body_dict
 
     def _process_phase_line(self, line, body_dict):
@@ -93,28 +142,22 @@ class ReaderFitaDigitalAfr13(ReaderFitaDigitalInterface):
         """
         
         try:
-            # Regex para encontrar hora (HH:MM:SS) seguida de texto
-            padrao = r'^(\d{2}:\d{2}:\d{2})\s+([A-Za-z0-9\s-]+)$'
-            match = re.match(padrao, line.strip())
+            # Hora (HH:MM:SS) seguida de texto
+            tipo, fase = _classify(line.strip())
             
-            if match:
-                hora = match.group(1)  # Captura a hora
-                fase = match.group(2).strip()  # Captura o texto após a hora e remove espaços extras
-                
-                # Adiciona como array ao invés de dicionário
-                body_dict['fase'].append([
-                    hora,
-                    fase
-                ])
+            if tipo == 'phase':
+                # Adiciona como array [hora, fase] ao invés de dicionário
+                body_dict['fase'].append(fase)
                 return True, body_dict
             
             return False, body_dict
             
         except Exception as e:
             # Log do erro para debug
-            print(f"Erro ao processar linha de fase: {str(e)}")
+            _logger.error(f"Erro ao processar linha de fase: {str(e)}")
             return False, body_dict
             
+    @cache_header
     def read_header(self):
         """
         Lê e processa o cabeçalho do arquivo de fita digital.
@@ -123,8 +166,8 @@ class ReaderFitaDigitalAfr13(ReaderFitaDigitalInterface):
             dict: Dicionário contendo as informações do cabeçalho
         """
         header = super().read_header()
-        _logger.debug(f"header: {header}")
-        header[self.header_fields.date_key] = datetime.strptime(header[self.header_fields.date_key], '%d-%m-%Y')
+        _logger.debug("header: %s", header)
+        header[self.header_fields.date_key] = _parse_data(header[self.header_fields.date_key])
         
         return header
 
@@ -147,18 +190,29 @@ class ReaderFitaDigitalAfr13(ReaderFitaDigitalInterface):
        
         # Processa o cabeçalho
         body_dict = self._process_header_line(lines_body, body_dict)
+
+        # Laço único com os mesmos critérios de _process_phase_line e
+        # _process_body_line, sem a chamada de método e o try por linha
+        data_append = body_dict['data'].append
+        fase_append = body_dict['fase'].append
+        # Como antes, self.body só é atualizado quando há alguma linha que não é de fase
+        atualiza_body = False
         
-        for line in lines_body[1:]:
-            line = line.strip()
-            
-            # Verifica se é uma linha de fase
-            is_phase, body_dict = self._process_phase_line(line, body_dict)
+        # Percorre as linhas após a de colunas sem copiar a lista do corpo
+        for line in islice(lines_body, 1, None):
+            tipo, valores = _classify(line.strip())
             
-            if is_phase:
+            # Linha de fase: [hora, fase]
+            if tipo == 'phase':
+                fase_append(valores)
                 continue
                     
-            # Processa linha de dados
-            body_dict = self._process_body_line(line, body_dict)
+            # Linha de dados: hora seguida dos valores numéricos
+            if tipo == 'data':
+                data_append([valores[0], *map(float, valores[1:])])
+            atualiza_body = True
+
+        if atualiza_body:
             self.body = body_dict
         return self.body
 
@@ -169,10 +223,7 @@ class ReaderFitaDigitalAfr13(ReaderFitaDigitalInterface):
         Returns:
             list: Lista contendo as linhas do corpo do arquivo
         """
-        if self.lines_file == []:
-            self.read_file()
-
-        self.lines_body_raw = self.lines_file[self.size_header:]
+        self.lines_body_raw = self.read_body_file_content()
 
         return self.lines_body_raw
 
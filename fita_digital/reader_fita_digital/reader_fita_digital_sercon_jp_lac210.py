@@ -1,8 +1,11 @@
-from .reader_fita_digital import ReaderFitaDigitalInterface
+from .reader_fita_digital import ReaderFitaDigitalInterface, cache_header, _parse_data
 import re
-from datetime import datetime,timedelta
-import os
+from datetime import timedelta
+from itertools import islice
 import logging
+
+import numpy as np
+
 _logger = logging.getLogger(__name__)
 
 
@@ -19,6 +22,11 @@ class ReaderFitaDigitalSerconJpLac210(ReaderFitaDigitalInterface):
         size_header (int): Tamanho do cabeçalho em linhas (padrão: 24 linhas)
     """
 
+    __slots__ = ()
+
+    # Padrões compilados uma única vez para todas as linhas e instâncias
+    _PHASE_LINE_RE = re.compile(r'^\s*(\d{2}:\d{2})\s+(.+?)\s*$')
+
     def __init__(self, full_path_file):
         """
         Inicializa o leitor de fita Sercon JP LAC 210.
@@ -28,6 +36,9 @@ class ReaderFitaDigitalSerconJpLac210(ReaderFitaDigitalInterface):
         """
         super().__init__(full_path_file)
         self.size_header = 25
+        # Palavras-chave de estado definidas uma única vez, não a cada get_state
+        self.state_finalized_keys = ["FIM DE CICLO"]
+        self.state_aborted_keys = ["CICLO ABORTADO"]
 
     def _process_header_line(self, lines_body, body_dict):
         """
@@ -44,17 +55,15 @@ class ReaderFitaDigitalSerconJpLac210(ReaderFitaDigitalInterface):
        
         if not lines_body:
             return body_dict
-        # Processa o cabeçalho se houver linhas
+        # Processa o cabeçalho se houver linhas; a linha é limpa uma única vez
         header_line = ''
         for line in lines_body:
-            if line.strip().startswith('HORA'):
-                header_line = line
+            stripped = line.strip()
+            if stripped.startswith('HORA'):
+                header_line = stripped
                 break
-        header_line = header_line.strip()
-        
-         
-        header_columns = header_line
-        body_dict['header_columns'] = header_columns.split()
+
+        body_dict['header_columns'] = header_line.split()
         return body_dict
 
     def _process_body_line(self, line, body_dict):
@@ -82,16 +91,14 @@ class ReaderFitaDigitalSerconJpLac210(ReaderFitaDigitalInterface):
             
                          
             
-            # Adiciona ":00" ao horário (primeiro valor)
-            hora_completa = valores[0]+ ":00"
-            medicao = [
-                hora_completa if i == 0 else float(valor)
-                for i, valor in enumerate(valores)
-            ]
-            body_dict['data'].append(medicao)
+            # Adiciona ":00" ao horário (primeiro valor) e converte os demais
+            # valores na própria lista, sem montar uma nova linha
+            valores[0] += ":00"
+            valores[1:] = map(float, valores[1:])
+            body_dict['data'].append(valores)
             
         except Exception as e:
-            print(f"Erro ao processar linha de medição: {str(e)}")
+            _logger.error(f"Erro ao processar linha de medição: {str(e)}")
             
         return body_dict
 
@@ -110,8 +117,7 @@ class ReaderFitaDigitalSerconJpLac210(ReaderFitaDigitalInterface):
         try:
            # print(line)
             # Regex para encontrar o padrão: hora (HH:MM) seguido de qualquer texto
-            padrao = r'^\s*(\d{2}:\d{2})\s+(.+?)\s*$'
-            match = re.match(padrao, line)
+            match = self._PHASE_LINE_RE.match(line)
           
             if match:
                 try:
@@ -136,9 +142,69 @@ class ReaderFitaDigitalSerconJpLac210(ReaderFitaDigitalInterface):
             
         except Exception as e:
             # Log do erro para debug
-            print(f"Erro ao processar linha de fase: {str(e)}")
+            _logger.error(f"Erro ao processar linha de fase: {str(e)}")
             return False, body_dict
             
+    def read_body(self):
+        """
+        Lê e processa o corpo do arquivo de fita digital em uma única passada.
+
+        Cada linha é dividida uma única vez e classificada pelos tokens, com os mesmos
+        critérios de _process_phase_line e _process_body_line: hora HH:MM seguida de um
+        texto que não começa por número é fase; linhas com hora e ao menos três valores
+        são medições.
+
+        Returns:
+            dict: Dicionário contendo os dados processados do arquivo, incluindo:
+                - header_columns: Colunas do cabeçalho
+                - data: Lista de medições realizadas durante o ciclo
+                - fase: Lista de horários e nomes das fases do ciclo
+        """
+        lines_body = self.read_body_file_content()
+
+        body_dict = {}
+        body_dict['data'] = []
+        body_dict['fase'] = []
+
+        # Processa o cabeçalho
+        body_dict = self._process_header_line(lines_body, body_dict)
+
+        data_append = body_dict['data'].append
+        fase_append = body_dict['fase'].append
+        # Como antes, self.body só é atualizado quando há alguma linha que não é de fase
+        atualiza_body = False
+
+        # Percorre as linhas após a de colunas sem copiar a lista do corpo
+        for line in islice(lines_body, 1, None):
+            valores = line.split()
+            hora = valores[0] if valores else ''
+
+            # Linha de fase: hora HH:MM seguida de texto que não começa por número
+            if (len(valores) > 1 and len(hora) == 5 and hora[2] == ':'
+                    and (hora[:2] + hora[3:]).isdecimal()):
+                try:
+                    float(valores[1])
+                except ValueError:
+                    fase_append([hora + ":00", line.strip()[5:].strip()])
+                    continue
+
+            atualiza_body = True
+            # Linha de medição: hora seguida de ao menos três valores
+            if len(valores) < 4:
+                continue
+            try:
+                valores[0] = hora + ":00"
+                valores[1:] = map(float, valores[1:])
+            except Exception as e:
+                _logger.error(f"Erro ao processar linha de medição: {str(e)}")
+                continue
+            data_append(valores)
+
+        if atualiza_body:
+            self.body = body_dict
+        return self.body
+
+    @cache_header
     def read_header(self):
         """
         Lê e processa o cabeçalho do arquivo de fita digital.
@@ -156,26 +222,27 @@ class ReaderFitaDigitalSerconJpLac210(ReaderFitaDigitalInterface):
         
         header = header_values
         for line in file_content:
+            # Uma única cópia sem espaços por linha; o valor é o trecho entre o
+            # primeiro e o segundo ':' (como o antigo line.split(':')[1])
+            stripped = line.strip()
+            chave, _, resto = stripped.partition(':')
+            valor = resto.partition(':')[0].strip()
 
-            # procurando data e hora de inicia do ciclo
-            value = line.split()
-            
-            
-            if line.strip().startswith('LOTE'):
-                header['LOTE'] = line.split(':')[1].strip() or ''
+            if chave.startswith('LOTE'):
+                header['LOTE'] = valor
                 continue
                 
-            if line.strip().startswith('CICLO.'):
-                header['CICLO'] = line.split(':')[1].strip().replace('\n', '') or ''
+            if chave.startswith('CICLO.'):
+                header['CICLO'] = valor
                 continue
 
-            if line.strip().startswith('SETPOINT'):
-                setpoint = line.split(':')[1].strip().replace('\n', '') or ''
-                if setpoint != '':
-                    setpoint = setpoint.split(' ')[0].strip()
-                    setpoint = float(setpoint.replace(',', '.'))
-                    header['SETPOINT'] = setpoint
+            if chave.startswith('SETPOINT'):
+                if valor != '':
+                    header['SETPOINT'] = float(valor.split(' ')[0].replace(',', '.'))
                 continue
+
+            # procurando data e hora de inicia do ciclo
+            value = stripped.split()
             if len(value) == 2:
                 if value[1].startswith('INICIANDO'):
                     
@@ -189,8 +256,8 @@ class ReaderFitaDigitalSerconJpLac210(ReaderFitaDigitalInterface):
                     break
         
         if 'Data:' not in header or 'Hora:' not in header:
-            header['Data:'] = header_values['create_date'].strftime('%d-%m-%Y')
-            header['Hora:'] = header_values['create_date'].strftime('%H:%M:%S')
+            # create_date já vem formatada como 'DD-MM-AAAA HH:MM:SS' (read_files_information)
+            header['Data:'], _, header['Hora:'] = header_values['create_date'].partition(' ')
             _logger.warning(f"Data e Hora não encontradas no arquivo {self.file_name}, usando data e hora do arquivo")
                     
        
@@ -198,7 +265,7 @@ class ReaderFitaDigitalSerconJpLac210(ReaderFitaDigitalInterface):
         
         
         
-        header[self.header_fields.date_key] = datetime.strptime(header[self.header_fields.date_key], '%d-%m-%Y')
+        header[self.header_fields.date_key] = _parse_data(header[self.header_fields.date_key])
         
         return header
   
@@ -231,8 +298,6 @@ class ReaderFitaDigitalSerconJpLac210(ReaderFitaDigitalInterface):
         try:
             if 'fase' not in self.body:
                 raise KeyError("Chave 'fase' não encontrada no dicionário body")
-            self.state_finalized_keys = ["FIM DE CICLO"]
-            self.state_aborted_keys = ["CICLO ABORTADO"]   
             # Verifica se é uma lista de fases
             if isinstance(self.body['fase'], list):
                 # Procura por fases de conclusão ou cancelamento
@@ -283,16 +348,18 @@ class ReaderFitaDigitalSerconJpLac210(ReaderFitaDigitalInterface):
             fig, ax1 = plt.subplots(figsize=(16, 9))
             ax2 = ax1.twinx()  # Cria um segundo eixo Y compartilhando o mesmo eixo X
             
-            # Extrai os dados do body
+            # Extrai os dados do body como colunas NumPy, reaproveitando os arrays
+            # das estatísticas (horários e matriz de valores sem a coluna de hora)
             times = []
             temperatures = []
             pressures = []
             
-            for row in body.get('data', []):
-                if len(row) >= 3:
-                    times.append(row[0])
-                    pressures.append(float(row[2]))  # PCI(Bar)
-                    temperatures.append(float(row[3]))  # TCI(Celsius)
+            dados = body.get('data', [])
+            if dados:
+                body_arr = self._arrays_body(body)
+                times, valores = body_arr['time'], body_arr['values']
+                pressures = valores[:, 1]  # PCI(Bar)
+                temperatures = valores[:, 2]  # TCI(Celsius)
 
 
             # Configura o formato do eixo X para mostrar HH:mm:ss
@@ -338,16 +405,21 @@ class ReaderFitaDigitalSerconJpLac210(ReaderFitaDigitalInterface):
             for fase in body.get('fase', []):
                 if len(fase) >= 2 and fase[1] in fases_permitidas:
                     fases_validas.append(fase)
+
+            # Horários das fases convertidos uma única vez; as durações entre fases
+            # consecutivas saem de um único np.diff, em segundos
+            tempos_fase = np.array([fase[0] for fase in fases_validas], dtype='datetime64[us]')
+            duracoes = np.diff(tempos_fase) / np.timedelta64(1, 's')
+            deslocamento_texto = timedelta(seconds=10)
             
             # Adiciona as fases e calcula o tempo entre elas
             for i, fase in enumerate(fases_validas):
                 tempo_fase = fase[0].strftime('%H:%M:%S')
                 ax1.axvline(x=fase[0], color='g', linestyle='--', alpha=0.5)
                 
-                # Calcula o tempo até a próxima fase
-                if i < len(fases_validas) - 1:
-                    tempo_entre_fases = fases_validas[i+1][0] - fase[0]
-                    segundos_totais = tempo_entre_fases.total_seconds()
+                # Tempo até a próxima fase
+                if i < len(duracoes):
+                    segundos_totais = duracoes[i]
                     minutos = int(segundos_totais // 60)
                     segundos = int(segundos_totais % 60)
                     texto_fase = f"{tempo_fase} - {fase[1]}\n{minutos:02d} min {segundos:02d} seg"
@@ -356,7 +428,7 @@ class ReaderFitaDigitalSerconJpLac210(ReaderFitaDigitalInterface):
                 
                
                     
-                ax1.text(fase[0]+timedelta(seconds=10), ax1.get_ylim()[0] + 2,
+                ax1.text(fase[0] + deslocamento_texto, ax1.get_ylim()[0] + 2,
                         texto_fase,
                         rotation=90,
                         verticalalignment='bottom',
@@ -1,7 +1,6 @@
-from .reader_fita_digital import ReaderFitaDigitalInterface
+from .reader_fita_digital import ReaderFitaDigitalInterface, cache_header, _parse_data, _estatisticas_colunas, _segundos_entre, _selecao_entre
 import re
-from datetime import datetime,timedelta
-import os
+from datetime import timedelta
 import logging
 import sys
 _logger = logging.getLogger(__name__)
@@ -20,6 +19,12 @@ class ReaderFitaDigitalSerconOr2011(ReaderFitaDigitalInterface):
         size_header (int): Tamanho do cabeçalho em linhas (padrão: 24 linhas)
     """
 
+    __slots__ = ()
+
+    # Padrões compilados uma única vez para todas as linhas e instâncias
+    _BODY_LINE_RE = re.compile(r'^\s*(\d{2}:\d{2}:\d{2})\s+(\d{3},\d)\s+(\d,\d{2})\s+(\d{4},\d)\s*$')
+    _PHASE_LINE_RE = re.compile(r'^\s*([^\d:]+)[.]*:?\s*(\d{2}:\d{2}:\d{2})\s*$')
+
     def __init__(self, full_path_file):
         """
         Inicializa o leitor de fita Sercon OR 2011.
@@ -74,8 +79,7 @@ class ReaderFitaDigitalSerconOr2011(ReaderFitaDigitalInterface):
             
             
             # Regex para validar linha com hora e valores numéricos com vírgulas
-            padrao = r'^\s*(\d{2}:\d{2}:\d{2})\s+(\d{3},\d)\s+(\d,\d{2})\s+(\d{4},\d)\s*$'
-            match = re.match(padrao, line.strip())
+            match = self._BODY_LINE_RE.match(line)
             
             
             if not match:
@@ -91,7 +95,7 @@ class ReaderFitaDigitalSerconOr2011(ReaderFitaDigitalInterface):
             body_dict['data'].append(medicao)
             
         except Exception as e:
-            print(f"Erro ao processar linha de medição: {str(e)}")
+            _logger.error(f"Erro ao processar linha de medição: {str(e)}")
             
         return body_dict
 
@@ -110,8 +114,7 @@ class ReaderFitaDigitalSerconOr2011(ReaderFitaDigitalInterface):
         try:
            
             # Regex para encontrar texto (com pontos opcionais) seguido de hora (HH:MM:SS)
-            padrao = r'^\s*([^\d:]+)[.]*:?\s*(\d{2}:\d{2}:\d{2})\s*$'
-            match = re.match(padrao, line.strip())
+            match = self._PHASE_LINE_RE.match(line)
           
             
             if match:
@@ -132,9 +135,10 @@ class ReaderFitaDigitalSerconOr2011(ReaderFitaDigitalInterface):
             
         except Exception as e:
             # Log do erro para debug
-            print(f"Erro ao processar linha de fase: {str(e)}")
+            _logger.error(f"Erro ao processar linha de fase: {str(e)}")
             return False, body_dict
             
+    @cache_header
     def read_header(self):
         """
         Lê e processa o cabeçalho do arquivo de fita digital.
@@ -182,15 +186,15 @@ class ReaderFitaDigitalSerconOr2011(ReaderFitaDigitalInterface):
         
 
             if 'Data:' not in header or 'Hora:' not in header:
-                header['Data:'] = header_values['create_date'].strftime('%d-%m-%Y')
-                header['Hora:'] = header_values['create_date'].strftime('%H:%M:%S')
+                # create_date já vem formatada como 'DD-MM-AAAA HH:MM:SS' (read_files_information)
+                header['Data:'], _, header['Hora:'] = header_values['create_date'].partition(' ')
                 _logger.warning(f"Data e Hora não encontradas no arquivo {self.file_name}, usando data e hora do arquivo")
         except Exception as e:
             _logger.error(f"Erro ao ler cabeçalho: {str(e)}")
 
-        _logger.debug(f"header: {header}")
+        _logger.debug("header: %s", header)
         try:
-            header[self.header_fields.date_key] = datetime.strptime(header[self.header_fields.date_key], '%d-%m-%Y')
+            header[self.header_fields.date_key] = _parse_data(header[self.header_fields.date_key])
         except Exception as e:
             _logger.error(f"Erro ao converter data: {str(e)} no metodo {sys._getframe().f_code.co_name}")
         
@@ -427,45 +431,28 @@ class ReaderFitaDigitalSerconOr2011(ReaderFitaDigitalInterface):
 
         if not phases:
             raise ValueError("Lista de fases não fornecida")
-        #filtrando as fases de interesse no body_fita
-        body_fases_filtradas = [x for x in body['fase'] if x[1] in phases]
+        # Índice nome da fase -> posição, montado uma única vez para todas as buscas
+        indice = self._arrays_body(body)['fase_index']
         
         estatisticas = {}
         # Para cada fase na lista
         for i in range(len(phases)-1):
             fase_atual = phases[i]
-            fase_proxima = None
     
-            # Calcula a duração entre as fases usando os índices
-            try:
-                idx_fase_atual = [f[1] for f in body['fase'] ].index(fase_atual)
-                print(f"idx_fase_atual: {idx_fase_atual}, fase_atual: {fase_atual}")
-                if idx_fase_atual is None:
-                    error_msg[i] = f"Não foi possível encontrar a fase {fase_atual}"
-                    continue
-                print(f"idx_fase_atual: {idx_fase_atual}")
-                idx_fase_proxima = None
-
-                for fproxima in phases[i+1:]:
-                    try:
-                        idx_fase_proxima =  [f[1] for f in body['fase']].index(fproxima)
-                        fase_proxima = fproxima
-                        break
-                    except ValueError as e:
-                        error_msg.append( f"Não foi possível encontrar a próxima fase {fproxima} para {fase_atual}: {str(e)}"  )  
-                        continue
-               
-                    
-                    
-                print(f"idx_fase_proxima: {idx_fase_proxima}")
-                duration = self.calcular_tempo_entre_fases(fase_atual, fproxima)
-                print(f"duration: {duration}")
-           
-            except ValueError as e:
-                error_msg.append( f"A fase {fase_atual} não foi encontrada: {str(e)}")
+            idx_fase_atual = indice.get(fase_atual)
+            if idx_fase_atual is None:
+                error_msg.append(f"A fase {fase_atual} não foi encontrada")
                 continue
-            except Exception as e:
-                error_msg.append( f"Erro ao calcular estatísticas do ciclo {fase_atual}: {str(e)}")
+            _logger.debug("idx_fase_atual: %s, fase_atual: %s", idx_fase_atual, fase_atual)
+
+            # Próxima fase da lista que existe na fita
+            fase_proxima = None
+            for fproxima in phases[i+1:]:
+                if fproxima in indice:
+                    fase_proxima = fproxima
+                    break
+                error_msg.append(f"Não foi possível encontrar a próxima fase {fproxima} para {fase_atual}")
+            _logger.debug("idx_fase_proxima: %s", indice.get(fase_proxima))
                 
             # Calcula as estatísticas entre as fases
             if fase_proxima is None:
@@ -487,7 +474,7 @@ class ReaderFitaDigitalSerconOr2011(ReaderFitaDigitalInterface):
         """
         Formata o dicionário de estatísticas do ciclo em colunas alinhadas.
         """
-        print(f"statistics: {statistics}")
+        _logger.debug("statistics: %s", statistics)
         linhas = []
         for fase, dados in statistics.items():
             minutos, segundos = dados['Duration'].split(':')
@@ -563,40 +550,18 @@ class ReaderFitaDigitalSerconOr2011(ReaderFitaDigitalInterface):
                 if not timestamp_inicial or not timestamp_final:
                     raise ValueError(f"Fases '{fase_inicial}' e/ou '{fase_final}' não encontradas")
                 
-                # Filtra dados entre as fases
-                dados = [linha for linha in dados 
-                        if timestamp_inicial <= linha[0] <= timestamp_final]
-                
-            # Inicializa dicionário de estatísticas
-            estatisticas = {}
-            
             # Pega os nomes das colunas, excluindo a coluna de tempo (índice 0)
             colunas = body.get('header_columns', [])[1:]
-            print(f"colunas: {colunas}")
-            # Para cada coluna numérica (índice > 0 nos dados)
-            for i, coluna in enumerate(colunas, start=1):
-                # Extrai valores da coluna
-                valores = [linha[i] for linha in dados]
-                if len(valores) == 0:
-                    continue
-                # Calcula estatísticas
-                maximo = max(valores)
-                minimo = min(valores)
-                media = sum(valores) / len(valores)
-                
-                # Calcula a moda
-                from statistics import mode
-                try:
-                    moda = mode(valores)
-                except:
-                    moda = None
-                    
-                estatisticas[coluna] = {
-                    'max': round(maximo, 2),
-                    'min': round(minimo, 2),
-                    'media': round(media, 2),
-                    'moda': round(moda, 2) if moda is not None else None
-                }
+            _logger.debug("colunas: %s", colunas)
+            body_arr = self._arrays_body(body)
+            valores = body_arr['values']
+
+            # Filtra dados entre as fases
+            if fase_inicial and fase_final:
+                valores = valores[_selecao_entre(body_arr, timestamp_inicial, timestamp_final)]
+
+            # Estatísticas de cada coluna numérica (índice > 0 nos dados)
+            estatisticas = _estatisticas_colunas(valores, colunas)
                 
             return estatisticas
             
@@ -622,15 +587,15 @@ class ReaderFitaDigitalSerconOr2011(ReaderFitaDigitalInterface):
                 raise ValueError("Fases não encontradas no body.")
 
             fases = self.body['fase']
-            # Busca os datetimes das fases
-            inicio = next((f[0] for f in fases if f[1] == fase_inicio), None)
-            fim = next((f[0] for f in fases if f[1] == fase_fim), None)
+            # Busca os horários das fases (datetimes ou strings da fita)
+            indice = self._arrays_body(self.body)['fase_index']
+            inicio = fases[indice[fase_inicio][0]][0] if fase_inicio in indice else None
+            fim = fases[indice[fase_fim][0]][0] if fase_fim in indice else None
 
             if not inicio or not fim:
                 raise ValueError(f"Fase(s) '{fase_inicio}' ou '{fase_fim}' não encontrada(s).")
 
-            tempo_decorrido = fim - inicio
-            total_segundos = int(tempo_decorrido.total_seconds())
+            total_segundos = _segundos_entre(inicio, fim)
             minutos = total_segundos // 60
             segundos = total_segundos % 60
             return f"{minutos:02d}:{segundos:02d}"
@@ -1,7 +1,6 @@
-from .reader_fita_digital import ReaderFitaDigitalInterface
+from .reader_fita_digital import ReaderFitaDigitalInterface, cache_header, _parse_data
 import re
-from datetime import datetime,timedelta
-import os
+from datetime import timedelta
 import logging
 _logger = logging.getLogger(__name__)
 
@@ -19,6 +18,11 @@ class ReaderFitaDigitalSerconTds(ReaderFitaDigitalInterface):
         size_header (int): Tamanho do cabeçalho em linhas (padrão: 24 linhas)
     """
 
+    __slots__ = ()
+
+    # Padrões compilados uma única vez para todas as linhas e instâncias
+    _PHASE_LINE_RE = re.compile(r'^\s*(\d{2}:\d{2})\s+-\s+(.+?)\s*$')
+
     def __init__(self, full_path_file):
         """
         Inicializa o leitor de fita Sercon TDS.
@@ -81,7 +85,7 @@ class ReaderFitaDigitalSerconTds(ReaderFitaDigitalInterface):
                 body_dict['data'].append(medicao)
             
         except Exception as e:
-            print(f"Erro ao processar linha de medição: {str(e)}")
+            _logger.error(f"Erro ao processar linha de medição: {str(e)}")
             
         return body_dict
 
@@ -99,8 +103,7 @@ class ReaderFitaDigitalSerconTds(ReaderFitaDigitalInterface):
         
         try:
             # Regex para encontrar o padrão: hora (HH:MM) seguido de qualquer texto
-            padrao = r'^\s*(\d{2}:\d{2})\s+-\s+(.+?)\s*$'   
-            match = re.match(padrao, line.strip())
+            match = self._PHASE_LINE_RE.match(line)
             
             if match:
                 hora = match.group(1)  # Captura a hora
@@ -119,9 +122,10 @@ class ReaderFitaDigitalSerconTds(ReaderFitaDigitalInterface):
             
         except Exception as e:
             # Log do erro para debug
-            print(f"Erro ao processar linha de fase: {str(e)}")
+            _logger.error(f"Erro ao processar linha de fase: {str(e)}")
             return False, body_dict
             
+    @cache_header
     def read_header(self):
         """
         Lê e processa o cabeçalho do arquivo de fita digital.
@@ -159,12 +163,12 @@ class ReaderFitaDigitalSerconTds(ReaderFitaDigitalInterface):
 
         
         if 'Data:' not in header or 'Hora:' not in header:
-            header['Data:'] = header['create_date'].strftime('%d-%m-%Y')
-            header['Hora:'] = header['create_date'].strftime('%H:%M:%S')
+            # create_date já vem formatada como 'DD-MM-AAAA HH:MM:SS' (read_files_information)
+            header['Data:'], _, header['Hora:'] = header['create_date'].partition(' ')
             _logger.warning(f"Data e Hora não encontradas no arquivo {self.file_name}, usando data e hora do arquivo")
         
-        _logger.debug(f"header: {header}")
-        header[self.header_fields.date_key] = datetime.strptime(header[self.header_fields.date_key], '%d-%m-%Y')
+        _logger.debug("header: %s", header)
+        header[self.header_fields.date_key] = _parse_data(header[self.header_fields.date_key])
         
         return header
 
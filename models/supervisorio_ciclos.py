@@ -10,6 +10,87 @@ import os
 _logger = logging.getLogger(__name__)
 import sys
 import base64
+from io import BytesIO
+from itertools import islice
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+# Layout do PDF gerado com ReportLab
+_RODAPE_X = 130
+_RODAPE_Y = 10
+_TEXT_SIZE = 8
+_LEADING = 0.1
+_LINE_SPACE = 8
+# Linhas por página: de y=800 até y=50, uma a cada _LINE_SPACE
+_LINES_PER_PAGE = (800 - 50) // _LINE_SPACE + 1
+# A cada quantas linhas o progresso da geração em segundo plano é gravado
+_PDF_PROGRESS_LINES = 500
+# Geração parada há mais que isto é considerada abandonada (ex.: worker reiniciado)
+_PDF_GENERATION_TIMEOUT = timedelta(minutes=10)
+_PDF_CRON_XMLID = 'afr_supervisorio_ciclos.ir_cron_generate_cycle_pdf'
+
+
+def _iter_lines(path):
+    """
+    Itera sobre as linhas do arquivo TXT sem carregar o arquivo inteiro em memória.
+
+    Args:
+        path (str): Caminho completo do arquivo
+
+    Yields:
+        str: Linha sem quebra de linha e sem caracteres nulos
+    """
+    # Lido em binário: os caracteres nulos são removidos com bytes.translate antes de decodificar
+    with open(path, 'rb', buffering=1 << 20) as file:
+        for line in file:
+            yield line.rstrip(b'\r\n').translate(None, b'\x00').decode('utf-8', 'replace')
+
+
+def _new_page(pdf, state):
+    """
+    Inicia uma nova página no PDF com a fonte e o rodapé.
+
+    Args:
+        pdf (Canvas): Canvas do ReportLab
+        state (dict): Estado da paginação; 'rodape' é a função que formata o rodapé a partir do número da página
+    """
+    pdf.showPage()  # Nova página
+    pdf.setFont('Courier', _TEXT_SIZE, leading=_LEADING)  # Precisa redefinir a fonte para nova página
+    state['pagina'] += 1
+    pdf.drawString(_RODAPE_X, _RODAPE_Y, state['rodape'](state['pagina']))
+    state['y'] = 800  # Reset posição Y
+
+
+def _draw_lines(pdf, line_iter, state):
+    """
+    Desenha as linhas no PDF, um objeto de texto por página, quebrando a página quando chega ao fim.
+
+    Args:
+        pdf (Canvas): Canvas do ReportLab
+        line_iter (iterable): Linhas a serem desenhadas
+        state (dict): Estado da paginação ({'y', 'pagina', 'rodape'}), atualizado no lugar
+    """
+    line_iter = iter(line_iter)
+    while True:
+        if state['y'] < 50:  # Se chegou ao fim da página
+            chunk = list(islice(line_iter, _LINES_PER_PAGE))
+            if not chunk:
+                return
+            _new_page(pdf, state)
+        else:
+            # Completa a página atual com as linhas que ainda cabem nela
+            chunk = list(islice(line_iter, (state['y'] - 50) // _LINE_SPACE + 1))
+            if not chunk:
+                return
+
+        # Um único objeto de texto por página em vez de um drawString por linha
+        text = pdf.beginText(50, state['y'])
+        text.setFont('Courier', _TEXT_SIZE, leading=_LINE_SPACE)
+        for line in chunk:
+            text.textLine(line)
+        pdf.drawText(text)
+        state['y'] -= _LINE_SPACE * len(chunk)  # Espaço entre linhas
+
 
 class SupervisorioCiclos(models.Model):
     _name = 'afr.supervisorio.ciclos'
@@ -118,6 +199,24 @@ class SupervisorioCiclos(models.Model):
     cycle_pdf_filename = fields.Char(
         string='Nome do Arquivo PDF'
     )
+    generation_state = fields.Selection([
+        ('none', 'Não Gerado'),
+        ('queued', 'Na Fila'),
+        ('running', 'Gerando'),
+        ('done', 'Concluído'),
+        ('error', 'Erro')
+    ], string='Geração do PDF', default='none', copy=False)
+    generation_progress = fields.Integer(string='Progresso da Geração (%)', default=0, copy=False)
+    generation_date = fields.Datetime(
+        string='Última Atividade da Geração',
+        copy=False,
+        help='Momento em que a geração do PDF foi agendada ou gravou progresso pela última vez'
+    )
+    generation_source_mtime = fields.Float(
+        string='Data do TXT do PDF',
+        copy=False,
+        help='Data de modificação (timestamp) do arquivo TXT usado para gerar o PDF'
+    )
     cycle_graph = fields.Image(
         string='Gráfico do Ciclo',
         compute='compute_cycle_graph', 
@@ -290,7 +389,7 @@ class SupervisorioCiclos(models.Model):
         data_final = data_final or datetime.now()
 
         lista_arquivos = self.ler_diretorio_ciclos(equipment_id=equipment_id,data_inicial=data_inicial,data_final=data_final)
-        _logger.debug(f"lista_arquivos: {lista_arquivos}")
+        _logger.debug("lista_arquivos: %s", lista_arquivos)
 
         self.processar_ciclos(lista_arquivos,equipment_id=equipment_id)
   
@@ -303,15 +402,15 @@ class SupervisorioCiclos(models.Model):
  
         for arquivo in lista_arquivos:
             #verifica se o ciclo já existe
-            _logger.debug(f"arquivo: {arquivo}")
+            _logger.debug("arquivo: %s", arquivo)
             ciclo_name = arquivo['name'].replace('.txt','')
             ciclo = self.env['afr.supervisorio.ciclos'].search([('name', '=', ciclo_name)])
             if ciclo:
-                _logger.debug(f"Ciclo {ciclo_name} já existe. Update dados do ciclo")
+                _logger.debug("Ciclo %s já existe. Update dados do ciclo", ciclo_name)
                 ciclo.update_cycle(arquivo,equipment_id)
                 continue
                
-            _logger.debug(f"Ciclo {ciclo_name} sendo criado para o equipamento {equipment_id}")
+            _logger.debug("Ciclo %s sendo criado para o equipamento %s", ciclo_name, equipment_id)
             self.update_cycle(arquivo,equipment_id)
 
 
@@ -341,12 +440,12 @@ class SupervisorioCiclos(models.Model):
                
                 # Importa dinamicamente o módulo que contém a classe
                 modulo = __import__(f"fita_digital.reader_fita_digital." +  re.sub(r'(?<!^)(?=[A-Z])', '_', nome_classe_leitor).lower(),fromlist=[nome_classe_leitor])
-                _logger.debug(f"modulo: {modulo}")     
+                _logger.debug("modulo: %s", modulo)     
                 
                 # Obtém a classe do módulo
                 classe_leitor = getattr(modulo, nome_classe_leitor)
                 
-                _logger.debug(f"Classe de leitor carregada: {nome_classe_leitor}")
+                _logger.debug("Classe de leitor carregada: %s", nome_classe_leitor)
                 
             except (ImportError, AttributeError) as e:
                 _logger.error(f"Erro ao carregar classe do leitor: {str(e)}. Usando leitor padrão ReaderFitaDigitalAfr13")
@@ -360,7 +459,7 @@ class SupervisorioCiclos(models.Model):
         body = None
         try:
             do = self._get_dataobject(equipment_id=equipment_id,file_path=arquivo['path'] + '/' + arquivo['name'])
-            header, body = do.read_all_fita()
+            header, body = do.read_all_fita_fast()
         except Exception as e:
             _logger.error(f"Erro ao atualizar ciclo: {str(e)}")
             
@@ -473,7 +572,7 @@ class SupervisorioCiclos(models.Model):
         
         lista_arquivos = do.ler_diretorio_ciclos(directory_path=equipment_id.cycle_path,extension_file_search=None,data_inicial=data_inicial,data_final=data_final)       
         
-        _logger.debug(f"lista_arquivos: {lista_arquivos}")
+        _logger.debug("lista_arquivos: %s", lista_arquivos)
         return lista_arquivos
   
     @api.depends('file_path')
@@ -481,9 +580,9 @@ class SupervisorioCiclos(models.Model):
         for record in self:
             if record.file_path and os.path.exists(record.file_path):
                 try:
-                    with open(record.file_path, 'r', encoding='utf-8') as file:
-                        record.cycle_txt = file.read()
-                        record.cycle_txt = record.cycle_txt.replace('\x00', '')
+                    # Remove os caracteres nulos ainda em bytes, sem uma segunda cópia em texto
+                    with open(record.file_path, 'rb') as file:
+                        record.cycle_txt = file.read().translate(None, b'\x00').decode('utf-8', 'replace')
                 except Exception as e:
                     _logger.error(f"Erro ao ler arquivo TXT: {str(e)}")
                     record.cycle_txt = False
@@ -491,7 +590,7 @@ class SupervisorioCiclos(models.Model):
                 record.cycle_txt = False
 
     def _get_dataobject(self,equipment_id=None,file_path=None):
-        _logger.debug(f"_get_dataobject equipment_id: {equipment_id}")
+        _logger.debug("_get_dataobject equipment_id: %s", equipment_id)
         equipment_id = self.equipment_id if self.id else equipment_id
         if not equipment_id:
             raise UserError("Nenhum equipamento informado")
@@ -539,7 +638,7 @@ class SupervisorioCiclos(models.Model):
         
 
         reader_class = self._carregar_classe_leitor(equipment_id)
-        _logger.debug(f"file_path: {file_path}")
+        _logger.debug("file_path: %s", file_path)
        
         do.register_reader_fita(reader_class(file_path), 
                                size_header=cycle_type_id.header_lines)
@@ -607,11 +706,11 @@ class SupervisorioCiclos(models.Model):
         Returns:
             dict: Dados da view
         """
-        _logger.debug(f"view_id: {view_id}")
-        _logger.debug(f"view_type: {view_type}")
-        _logger.debug(f"options: {options}")
-        _logger.debug(f"self: {self}")
-        _logger.debug(f"self.cycle_type_id: {self.cycle_type_id}")
+        _logger.debug("view_id: %s", view_id)
+        _logger.debug("view_type: %s", view_type)
+        _logger.debug("options: %s", options)
+        _logger.debug("self: %s", self)
+        _logger.debug("self.cycle_type_id: %s", self.cycle_type_id)
 
         # Se for view tipo form e tiver cycle_type_id configurado
         # if view_type == 'form':
@@ -619,7 +718,7 @@ class SupervisorioCiclos(models.Model):
         #     _logger.debug(f"Usando view específica do tipo de ciclo: {view_id}")
             
         res = super(SupervisorioCiclos, self).get_view(view_id, view_type, **options)
-        _logger.debug(f"res: {res}")
+        _logger.debug("res: %s", res)
             
         return res
 
@@ -636,6 +735,206 @@ class SupervisorioCiclos(models.Model):
             _logger.error(f"Erro ao ler arquivo: {str(e)}")
             return f"Erro ao ler arquivo: {str(e)}"
 
+    def _get_cycle_txt_blocks(self, block_size=500):
+        """
+        Divide o conteúdo do TXT em blocos de linhas para o relatório QWeb.
+
+        Blocos <pre> muito longos deixam a paginação do wkhtmltopdf muito lenta,
+        por isso o template renderiza um <pre> por bloco.
+
+        Args:
+            block_size (int): Quantidade de linhas por bloco
+
+        Returns:
+            list: Lista de strings, cada uma com até block_size linhas
+        """
+        self.ensure_one()
+        lines = (self.cycle_txt or '').splitlines()
+        return ['\n'.join(lines[i:i + block_size]) for i in range(0, len(lines), block_size)]
+
+    def _write_cycle_pdf(self, fileobj, progress_callback=None):
+        """
+        Escreve o PDF do ciclo (TXT seguido das estatísticas) com ReportLab.
+
+        Args:
+            fileobj (file): Arquivo binário onde o PDF é escrito
+            progress_callback (callable): Chamada a cada _PDF_PROGRESS_LINES linhas com o progresso (%)
+        """
+        self.ensure_one()
+        msg_rodape = f"Ciclo cod.: {self.name} - Gerado pelo sistema FITADIGITAL"
+
+        # invariant=1 torna a saída determinística: o mesmo ciclo gera sempre os mesmos bytes
+        pdf = canvas.Canvas(fileobj, pagesize=A4, pageCompression=1, invariant=1)
+        
+        # Define a fonte como Courier para manter o formato monospace
+        pdf.setFont('Courier', _TEXT_SIZE, leading=_LEADING)
+        
+        # Rodapé montado uma única vez; por página só o número é formatado
+        rodape = (msg_rodape.replace('{', '{{').replace('}', '}}') + " - Página {}").format
+        state = {'y': 800, 'pagina': 1, 'rodape': rodape}
+        pdf.drawString(_RODAPE_X, _RODAPE_Y, rodape(state['pagina']))
+
+        txt_lines = _iter_lines(self.file_path)
+        if progress_callback:
+            txt_lines = self._iter_with_progress(txt_lines, os.path.getsize(self.file_path), progress_callback)
+       
+        # Adiciona cada linha do TXT ao PDF à medida que é lida
+        _draw_lines(pdf, txt_lines, state)
+        
+        # Estatísticas do ciclo começam em nova página; só são divididas em linhas
+        # depois que o TXT foi desenhado, nunca há duas listas completas em memória
+        stats_lines = self.cycle_statistics_txt.splitlines() if self.cycle_statistics_txt else ()
+        _new_page(pdf, state)
+        _draw_lines(pdf, stats_lines, state)
+        
+        pdf.save()
+
+    @staticmethod
+    def _iter_with_progress(lines, total_size, progress_callback):
+        """
+        Repassa as linhas informando o progresso pela quantidade de caracteres lidos.
+
+        Args:
+            lines (iterable): Linhas do arquivo
+            total_size (int): Tamanho do arquivo em bytes
+            progress_callback (callable): Recebe o progresso (%) a cada _PDF_PROGRESS_LINES linhas
+
+        Yields:
+            str: As mesmas linhas recebidas
+        """
+        lidos = 0
+        for i, line in enumerate(lines, 1):
+            lidos += len(line) + 1
+            if total_size and not i % _PDF_PROGRESS_LINES:
+                progress_callback(min(99, lidos * 100 // total_size))
+            yield line
+
+    def _get_cycle_pdf_attachment(self):
+        """
+        Retorna o anexo do campo cycle_pdf.
+
+        Returns:
+            ir.attachment: Anexo do PDF (vazio se não existir)
+        """
+        self.ensure_one()
+        return self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_field', '=', 'cycle_pdf'),
+            ('res_id', '=', self.id),
+        ], limit=1)
+
+    def _is_cycle_pdf_current(self, st=None):
+        """
+        Indica se o PDF gerado corresponde à versão atual do arquivo TXT.
+
+        Args:
+            st (os.stat_result): Stat do arquivo TXT, se já obtido pelo chamador
+
+        Returns:
+            bool: True se o PDF está pronto e o TXT não mudou desde a geração
+        """
+        self.ensure_one()
+        if self.generation_state != 'done' or not self.file_path:
+            return False
+        if st is None:
+            try:
+                st = os.stat(self.file_path)
+            except OSError:
+                return False
+        return st.st_mtime == self.generation_source_mtime
+
+    def action_generate_pdf_async(self, retry=False):
+        """
+        Agenda a geração do PDF dos ciclos pelo cron de geração.
+
+        Os ciclos são reservados com um UPDATE condicional: só passam para 'queued'
+        os que não estão na fila nem sendo gerados, ou cuja geração está parada
+        (generation_date) há mais de _PDF_GENERATION_TIMEOUT. Assim, duas
+        requisições simultâneas não agendam o mesmo PDF duas vezes.
+
+        Args:
+            retry (bool): Se True, agenda também os ciclos que terminaram com erro
+
+        Returns:
+            list: IDs dos ciclos agendados
+        """
+        records = self.filtered('file_path')
+        if not records:
+            return []
+        # O UPDATE abaixo não passa pelo ORM: as permissões são verificadas antes
+        records.check_access_rights('write')
+        records.check_access_rule('write')
+        self.flush_model(['generation_state', 'generation_progress', 'generation_date'])
+
+        estados_livres = ('none', 'done', 'error') if retry else ('none', 'done')
+        self.env.cr.execute("""
+            UPDATE afr_supervisorio_ciclos
+               SET generation_state = 'queued',
+                   generation_progress = 0,
+                   generation_date = (now() at time zone 'UTC')
+             WHERE id IN %s
+               AND (generation_state IS NULL
+                    OR generation_state IN %s
+                    OR (generation_state IN ('queued', 'running')
+                        AND (generation_date IS NULL
+                             OR generation_date < (now() at time zone 'UTC') - %s)))
+         RETURNING id
+        """, (tuple(records.ids), estados_livres, _PDF_GENERATION_TIMEOUT))
+        ids = [row[0] for row in self.env.cr.fetchall()]
+        records.invalidate_recordset(['generation_state', 'generation_progress', 'generation_date'])
+
+        if ids:
+            # O cron roda fora do worker HTTP; _trigger o executa assim que a transação for confirmada
+            self.env.ref(_PDF_CRON_XMLID).sudo()._trigger()
+        return ids
+
+    @api.model
+    def _cron_generate_cycle_pdfs(self):
+        """
+        Gera os PDFs dos ciclos que estão na fila ('queued').
+        """
+        self.search([('generation_state', '=', 'queued')])._generate_cycle_pdf()
+
+    def _generate_cycle_pdf(self):
+        """
+        Gera e grava o PDF de cada ciclo, confirmando o progresso a cada bloco de linhas.
+
+        Executado pelo cron de geração; cada commit libera o cursor para que a
+        página de progresso enxergue o andamento.
+        """
+        cr = self.env.cr
+        # O PDF gerado pelo cron não é uma alteração do usuário: não registra
+        # mensagens de rastreamento (cycle_pdf tem tracking) no chatter
+        for record in self.with_context(tracking_disable=True):
+            try:
+                mtime = os.stat(record.file_path).st_mtime
+                record.write({
+                    'generation_state': 'running',
+                    'generation_progress': 0,
+                    'generation_date': fields.Datetime.now(),
+                })
+                cr.commit()
+
+                def progress(pct, record=record):
+                    record.write({'generation_progress': pct, 'generation_date': fields.Datetime.now()})
+                    cr.commit()
+
+                pdf_buffer = BytesIO()
+                record._write_cycle_pdf(pdf_buffer, progress)
+                record.write({
+                    'cycle_pdf': base64.b64encode(pdf_buffer.getvalue()),
+                    'cycle_pdf_filename': os.path.basename(record.file_path).replace('.txt', '.pdf'),
+                    'generation_state': 'done',
+                    'generation_progress': 100,
+                    'generation_source_mtime': mtime,
+                })
+                cr.commit()
+            except Exception as e:
+                cr.rollback()
+                _logger.error(f"Erro ao gerar PDF do ciclo {record.id}: {str(e)}")
+                record.write({'generation_state': 'error'})
+                cr.commit()
+
     @api.depends('cycle_txt')
     def _compute_statistics(self):
         """